@@ -4,27 +4,38 @@ Includes: Summary, Images, Trends, Sources, Export PDF - All working properly
 """
 
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 from datetime import datetime, timedelta
+import csv
+import io
 import json
-import time
 import os
 import logging
-from typing import Dict, List
-import numpy as np
+import threading
+from collections import Counter
+from itertools import islice
+from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
+from typing import Any, Dict, List, Optional, TypedDict
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
+# Set up logging on a dedicated logger; the guard keeps Streamlit reruns from
+# stacking handlers and leaves the root logger to Streamlit
+logger = logging.getLogger("research_agent")
+if not logger.handlers:
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
 
 # Core imports with error handling
 try:
     from modules.web_search import WebSearchEngine
     from modules.content_extractor import ContentExtractor  
     from modules.ai_summarizer import AISummarizer
-    from utils.pdf_generator import PDFGenerator
     from config import Config
     CORE_MODULES_AVAILABLE = True
 except ImportError as e:
@@ -51,6 +62,13 @@ try:
 except ImportError:
     IMAGE_PROCESSING_AVAILABLE = False
 
+# Fast JSON encoding for exports (optional)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Page configuration
 st.set_page_config(
     page_title="AI Research Agent",
@@ -59,210 +77,15 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+@st.cache_data(show_spinner=False)
+def load_css(path):
+    """Read a static stylesheet once; later reruns are served from the cache"""
+    with open(path, encoding='utf-8') as f:
+        return f.read()
+
 # Enhanced CSS styling for modern, interactive layout
-st.markdown("""
-<style>
-    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap');
-    
-    .stApp {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        font-family: 'Inter', sans-serif;
-    }
-    
-    .main .block-container {
-        padding: 2rem;
-        background: rgba(255, 255, 255, 0.95);
-        border-radius: 20px;
-        box-shadow: 0 20px 40px rgba(0, 0, 0, 0.1);
-        backdrop-filter: blur(10px);
-        margin: 1rem;
-    }
-    
-    .main-header {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        padding: 3rem 2rem;
-        border-radius: 20px;
-        margin-bottom: 2rem;
-        text-align: center;
-        box-shadow: 0 15px 35px rgba(102, 126, 234, 0.3);
-        animation: fadeInDown 0.8s ease-out;
-    }
-    
-    .main-header h1 {
-        color: white;
-        font-size: 3.5rem;
-        font-weight: 700;
-        margin: 0;
-        text-shadow: 2px 2px 4px rgba(0, 0, 0, 0.3);
-    }
-    
-    .main-header h3 {
-        color: rgba(255, 255, 255, 0.9);
-        font-size: 1.4rem;
-        font-weight: 400;
-        margin: 1rem 0 0 0;
-        text-shadow: 1px 1px 2px rgba(0, 0, 0, 0.2);
-    }
-    
-    .feature-badge {
-        background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%);
-        color: white;
-        padding: 1rem 2rem;
-        border-radius: 50px;
-        margin: 2rem auto;
-        max-width: 900px;
-        text-align: center;
-        font-weight: 600;
-        font-size: 1.2rem;
-        box-shadow: 0 10px 30px rgba(79, 172, 254, 0.4);
-        animation: pulse 2s infinite;
-    }
-    
-    .search-container {
-        background: linear-gradient(135deg, #ffffff 0%, #f8f9ff 100%);
-        padding: 2rem;
-        border-radius: 20px;
-        box-shadow: 0 15px 35px rgba(0, 0, 0, 0.1);
-        margin: 2rem 0;
-        border: 2px solid rgba(102, 126, 234, 0.1);
-        transition: all 0.3s ease;
-    }
-    
-    .search-container:hover {
-        transform: translateY(-5px);
-        box-shadow: 0 25px 50px rgba(0, 0, 0, 0.15);
-        border-color: rgba(102, 126, 234, 0.3);
-    }
-    
-    .stButton > button {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        border: none;
-        border-radius: 15px;
-        padding: 1rem 2rem;
-        font-size: 1.1rem;
-        font-weight: 600;
-        transition: all 0.3s ease;
-        box-shadow: 0 8px 25px rgba(102, 126, 234, 0.4);
-        width: 100%;
-    }
-    
-    .stButton > button:hover {
-        transform: translateY(-3px);
-        box-shadow: 0 15px 40px rgba(102, 126, 234, 0.5);
-        background: linear-gradient(135deg, #5a6fd8 0%, #6a4190 100%);
-    }
-    
-    .metric-card {
-        background: linear-gradient(135deg, #ffffff 0%, #f8f9ff 100%);
-        padding: 1.5rem;
-        border-radius: 15px;
-        box-shadow: 0 10px 25px rgba(0, 0, 0, 0.1);
-        margin: 0.5rem 0;
-        transition: all 0.3s ease;
-        border-left: 4px solid;
-        text-align: center;
-    }
-    
-    .metric-card:hover {
-        transform: translateY(-5px);
-        box-shadow: 0 20px 40px rgba(0, 0, 0, 0.15);
-    }
-    
-    .stTabs [data-baseweb="tab-list"] {
-        gap: 1rem;
-        background: linear-gradient(135deg, #f8f9ff 0%, #ffffff 100%);
-        border-radius: 20px;
-        padding: 1rem;
-        box-shadow: 0 8px 25px rgba(0, 0, 0, 0.1);
-        margin: 2rem 0;
-    }
-    
-    .stTabs [data-baseweb="tab"] {
-        background: transparent;
-        border-radius: 12px;
-        padding: 1rem 2rem;
-        transition: all 0.3s ease;
-        border: 2px solid transparent;
-        font-weight: 500;
-    }
-    
-    .stTabs [aria-selected="true"] {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        box-shadow: 0 8px 20px rgba(102, 126, 234, 0.4);
-        transform: translateY(-2px);
-    }
-    
-    .stTabs [data-baseweb="tab"]:hover {
-        background: rgba(102, 126, 234, 0.1);
-        transform: translateY(-3px);
-        border-color: rgba(102, 126, 234, 0.3);
-    }
-    
-    .stTextInput > div > div > input {
-        background: linear-gradient(135deg, #f8f9ff 0%, #ffffff 100%);
-        border: 2px solid #e1e8f0;
-        border-radius: 15px;
-        padding: 1rem 1.5rem;
-        font-size: 1.1rem;
-        transition: all 0.3s ease;
-        box-shadow: 0 5px 15px rgba(0, 0, 0, 0.05);
-    }
-    
-    .stTextInput > div > div > input:focus {
-        border-color: #667eea;
-        box-shadow: 0 10px 30px rgba(102, 126, 234, 0.2);
-        transform: translateY(-2px);
-    }
-    
-    .stProgress > div > div > div {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        border-radius: 10px;
-    }
-    
-    .stAlert {
-        border-radius: 12px;
-        border: none;
-        box-shadow: 0 4px 15px rgba(0, 0, 0, 0.1);
-    }
-    
-    .stSuccess {
-        background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%);
-        color: white;
-    }
-    
-    .streamlit-expanderHeader {
-        background: linear-gradient(135deg, #f8f9ff 0%, #ffffff 100%);
-        border-radius: 10px;
-        margin: 0.5rem 0;
-        transition: all 0.3s ease;
-        border: 1px solid rgba(102, 126, 234, 0.1);
-    }
-    
-    .streamlit-expanderHeader:hover {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        transform: translateY(-2px);
-        box-shadow: 0 4px 15px rgba(102, 126, 234, 0.3);
-    }
-    
-    @keyframes fadeInDown {
-        from { opacity: 0; transform: translateY(-30px); }
-        to { opacity: 1; transform: translateY(0); }
-    }
-    
-    @keyframes pulse {
-        0%, 100% { box-shadow: 0 10px 30px rgba(79, 172, 254, 0.4); }
-        50% { box-shadow: 0 15px 40px rgba(79, 172, 254, 0.6); }
-    }
-    
-    /* Hide Streamlit branding */
-    #MainMenu {visibility: hidden;}
-    footer {visibility: hidden;}
-    header {visibility: hidden;}
-</style>
-""", unsafe_allow_html=True)
+CSS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'assets', 'app.css')
+st.markdown(f"<style>{load_css(CSS_PATH)}</style>", unsafe_allow_html=True)
 
 # Initialize session state
 if 'research_results' not in st.session_state:
@@ -272,83 +95,284 @@ if 'search_query' not in st.session_state:
 if 'research_history' not in st.session_state:
     st.session_state.research_history = []
 
+# Only this much page text per extracted source is kept in session state; it covers
+# every display/export excerpt and the full page stays available via cached_extract(url)
+STORED_CONTENT_CHARS = 2000
+
+# Search-snippet budgets as (snippets, chars per snippet, total chars): Quick mode
+# summarizes snippets directly, Advanced mode only falls back to them
+QUICK_SNIPPET_BUDGET = (5, 300, 2000)
+ADVANCED_SNIPPET_BUDGET = (8, 500, 3000)
+
+class Source(TypedDict, total=False):
+    """Fields the display and export code reads from a search result.
+    
+    Sources stay plain dicts: they are hashed by st.cache_data and
+    serialized into the JSON export.
+    Hot render loops read precomputed fields from prepare_sources_view().
+    """
+    title: str
+    url: str
+    snippet: str
+    domain: str
+    score: float
+    source: str
+    date: str
+    image_url: str
+    result_type: str
+
+class ResearchResults(TypedDict):
+    """Shape of st.session_state.research_results"""
+    query: str
+    search_results: Any
+    search_results_list: List[Source]
+    extracted_content: List[Dict]
+    summary: Dict
+    historical_data: Optional[Dict]
+    image_results: Optional[Dict]
+    timestamp: datetime
+    mode: str
+    search_speed: str
+    settings: Dict
+
+def compact_extracted_content(extracted_content):
+    """Trim page text of extracted sources before storing them in session state"""
+    return [
+        {**content, **{key: content[key][:STORED_CONTENT_CHARS] for key in ('text', 'content') if isinstance(content.get(key), str)}}
+        for content in extracted_content
+    ]
+
+# st.fragment landed in Streamlit 1.37; older versions simply rerun the whole script
+fragment = getattr(st, 'fragment', None) or getattr(st, 'experimental_fragment', None) or (lambda func: func)
+
 def safe_api_call(func, *args, **kwargs):
     """Safely call API functions with error handling"""
     try:
         return func(*args, **kwargs)
     except Exception as e:
-        logger.error(f"API call failed: {str(e)}")
+        logger.error("API call failed: %s", e)
         return {"error": str(e), "success": False}
 
-def main():
-    """Main application function"""
-    
-    # Header with enhanced capabilities
-    st.markdown('<h1 style="text-align: center; color: #1f77b4;">🤖 AI Research Agent - Enhanced</h1>', unsafe_allow_html=True)
-    st.markdown('<h3 style="text-align: center; color: #666666;">ChatGPT-Style Analysis • Quick & Advanced Search • Structured Reports</h3>', unsafe_allow_html=True)
-    
-    # Show feature status with timing
-    feature_count = sum([CORE_MODULES_AVAILABLE, ENHANCED_FEATURES_AVAILABLE, HISTORICAL_DATA_AVAILABLE, IMAGE_PROCESSING_AVAILABLE])
+def bounded_join(parts, per_item, total, sep=" "):
+    """Join up to per_item chars of each part, stopping once total chars are collected"""
+    buf, used = [], 0
+    for part in parts:
+        if not part:
+            continue
+        take = part[:min(per_item, total - used)]
+        buf.append(take)
+        used += len(take) + len(sep)
+        if used >= total:
+            break
+    return sep.join(buf)
+
+class ThrottledProgress:
+    """Progress bar + status line that only forwards meaningful changes to the browser"""
+    
+    def __init__(self, bar, status, step=5):
+        self._bar = bar
+        self._status = status
+        self._step = step
+        self._last_pct = 0
+        self._last_msg = None
+    
+    def set(self, pct, msg=None):
+        if pct - self._last_pct >= self._step or (pct == 100 and self._last_pct != 100):
+            self._bar.progress(pct)
+            self._last_pct = pct
+        if msg is not None and msg != self._last_msg:
+            self._status.text(msg)
+            self._last_msg = msg
+
+def set_search_query(query):
+    """Button callback that pre-fills the research query"""
+    st.session_state.search_query = query
+
+# Cached resource factories - built once per process and shared across reruns/sessions
+@st.cache_resource
+def get_config():
+    return Config()
+
+@st.cache_resource
+def get_search_engine():
+    return WebSearchEngine()
+
+@st.cache_resource
+def get_enhanced_search():
+    return EnhancedSearchEngine()
+
+def new_http_session():
+    """Pooled HTTP session so repeated page fetches reuse TCP/TLS connections"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=Retry(total=2, backoff_factor=0.3))
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+# requests.Session isn't thread-safe, so each extraction thread keeps its own
+# extractor and session instead of sharing one through st.cache_resource
+_extractor_local = threading.local()
+
+def get_extractor():
+    extractor = getattr(_extractor_local, 'extractor', None)
+    if extractor is None:
+        extractor = _extractor_local.extractor = ContentExtractor(session=new_http_session())
+    return extractor
+
+@st.cache_resource
+def get_extraction_pool():
+    """Long-lived fetch threads, so their per-thread sessions keep connections open across runs"""
+    return ThreadPoolExecutor(max_workers=Config.MAX_CONCURRENT_REQUESTS, thread_name_prefix="extract")
+
+def run_in_script_ctx(ctx, fn, *args):
+    """Run fn on a worker thread under the submitting script run's context, so
+    st.cache_data and other Streamlit calls inside it see the active session"""
+    add_script_run_ctx(threading.current_thread(), ctx)
+    return fn(*args)
+
+@st.cache_resource
+def get_summarizer():
+    return AISummarizer()
+
+@st.cache_resource
+def get_historical_analyzer():
+    return HistoricalDataAnalyzer()
+
+@st.cache_resource
+def get_image_processor():
+    return EnhancedImageProcessor()
+
+@st.cache_resource
+def get_pdf_generator():
+    # reportlab is only imported once someone actually exports a PDF
+    from utils.pdf_generator import PDFGenerator
+    return PDFGenerator()
+
+# Memoized network calls. st.cache_data only skips storing a result when the
+# function raises, and the search engines and extractor report failures by
+# returning empty results, so those are turned into exceptions here to keep a
+# transient outage from being cached for the whole TTL.
+@st.cache_data(ttl=3600, max_entries=128, show_spinner=False)
+def cached_search(query, num_results, mode):
+    """Search results memoized per (query, num_results, mode); empty results are not cached"""
+    if mode == "Enhanced" and ENHANCED_FEATURES_AVAILABLE:
+        results = get_enhanced_search().fast_search_and_analyze(query, num_results)
+    else:
+        results = get_search_engine().search(query, num_results)
     
+    if not results or (isinstance(results, dict) and (results.get('error') or not results.get('search_results'))):
+        raise ValueError(f"No search results for '{query}'")
+    return results
+
+@st.cache_data(ttl=86400, max_entries=512, show_spinner=False)
+def cached_extract(url):
+    """Extracted page content memoized per URL; failed extractions are not cached"""
+    content = get_extractor().extract_from_url(url)
+    if not content:
+        raise ValueError(f"Content extraction failed for {url}")
+    return content
+
+@st.cache_data(show_spinner=False)
+def feature_status_html(feature_count):
+    """Feature status banner; a pure function of how many feature sets loaded"""
     status_color = "green" if feature_count >= 3 else "blue" if feature_count >= 2 else "orange"
     status_text = f"⚡ {feature_count}/4 FEATURE SETS ACTIVE"
     
-    st.markdown(f"""
+    return f"""
     <div style="text-align: center; margin-bottom: 2rem;">
         <div style="background: {status_color}; color: white; padding: 0.5rem; border-radius: 20px; margin: 1rem auto; max-width: 700px;">
             {status_text}: ⚡ Quick Search (5-15s) • 🔬 Advanced Search (30-60s) • 📊 Structured Analysis • 📄 Professional Export
         </div>
     </div>
-    """, unsafe_allow_html=True)
+    """
+
+@fragment
+def sidebar_controls():
+    """Sidebar settings; widget changes only rerun this fragment, not the whole app"""
+    st.header("⚙️ Configuration")
+    
+    # API Status
+    try:
+        config = get_config()
+        validation = config.validate_api_keys()
+        st.subheader("📊 API Status")
+        st.write(f"**Working APIs:** {validation.get('working_count', 0)}")
+        if validation.get('search_engines'):
+            st.write(f"🔍 **Search:** {', '.join(validation['search_engines'])}")
+    except Exception as e:
+        st.error(f"Config error: {str(e)}")
+    
+    # Research settings
+    st.subheader("🔍 Research Settings")
+    
+    # NEW: Search Speed Options
+    search_speed = st.radio(
+        "🚀 Search Speed",
+        ["⚡ Quick Search (5-15 seconds)", "🔬 Advanced Search (30-60 seconds)"],
+        help="Quick: Fast results with basic analysis | Advanced: Comprehensive research with detailed analysis"
+    )
+    
+    # Dynamic settings based on search speed
+    if "Quick" in search_speed:
+        num_results = st.slider("Number of results", 3, 8, 5)
+        search_mode = "Standard"
+        include_images = st.checkbox("Include images", value=False)
+        include_trends = st.checkbox("Include trend analysis", value=False)
+        summary_type = "brief"
+        st.info("⚡ Quick mode: Optimized for speed with essential information")
+    else:
+        num_results = st.slider("Number of results", 10, 25, 15)
+        search_mode = st.radio("Search Mode", ["Enhanced", "Standard"]) if ENHANCED_FEATURES_AVAILABLE else "Standard"
+        include_images = st.checkbox("Include images", value=True)
+        include_trends = st.checkbox("Include trend analysis", value=True)
+        summary_type = st.selectbox("Summary type", ["comprehensive", "detailed", "brief"])
+        st.info("🔬 Advanced mode: Comprehensive analysis with detailed insights")
+    
+    enable_visualizations = st.checkbox("Enable charts", value=True)
+    
+    # NEW: Output Format Options
+    st.subheader("📋 Output Format")
+    detailed_formatting = st.checkbox("📝 ChatGPT-style detailed formatting", value=True, help="Bullet points, headings, tables, structured analysis")
+    include_tables = st.checkbox("📊 Include data tables", value=True)
+    include_bullet_points = st.checkbox("• Enhanced bullet points", value=True)
+    
+    return {
+        'search_speed': search_speed,
+        'num_results': num_results,
+        'search_mode': search_mode,
+        'include_images': include_images,
+        'include_trends': include_trends,
+        'summary_type': summary_type,
+        'enable_visualizations': enable_visualizations,
+        'detailed_formatting': detailed_formatting,
+        'include_tables': include_tables,
+        'include_bullet_points': include_bullet_points
+    }
+
+def main():
+    """Main application function"""
+    
+    # Header with enhanced capabilities
+    st.markdown('<h1 style="text-align: center; color: #1f77b4;">🤖 AI Research Agent - Enhanced</h1>', unsafe_allow_html=True)
+    st.markdown('<h3 style="text-align: center; color: #666666;">ChatGPT-Style Analysis • Quick & Advanced Search • Structured Reports</h3>', unsafe_allow_html=True)
+    
+    # Show feature status with timing
+    feature_count = sum([CORE_MODULES_AVAILABLE, ENHANCED_FEATURES_AVAILABLE, HISTORICAL_DATA_AVAILABLE, IMAGE_PROCESSING_AVAILABLE])
+    st.markdown(feature_status_html(feature_count), unsafe_allow_html=True)
     
     # Sidebar configuration
     with st.sidebar:
-        st.header("⚙️ Configuration")
-        
-        # API Status
-        try:
-            config = Config()
-            validation = config.validate_api_keys()
-            st.subheader("📊 API Status")
-            st.write(f"**Working APIs:** {validation.get('working_count', 0)}")
-            if validation.get('search_engines'):
-                st.write(f"🔍 **Search:** {', '.join(validation['search_engines'])}")
-        except Exception as e:
-            st.error(f"Config error: {str(e)}")
-        
-        # Research settings
-        st.subheader("🔍 Research Settings")
-        
-        # NEW: Search Speed Options
-        search_speed = st.radio(
-            "🚀 Search Speed",
-            ["⚡ Quick Search (5-15 seconds)", "🔬 Advanced Search (30-60 seconds)"],
-            help="Quick: Fast results with basic analysis | Advanced: Comprehensive research with detailed analysis"
-        )
-        
-        # Dynamic settings based on search speed
-        if "Quick" in search_speed:
-            num_results = st.slider("Number of results", 3, 8, 5)
-            search_mode = "Standard"
-            include_images = st.checkbox("Include images", value=False)
-            include_trends = st.checkbox("Include trend analysis", value=False)
-            summary_type = "brief"
-            st.info("⚡ Quick mode: Optimized for speed with essential information")
-        else:
-            num_results = st.slider("Number of results", 10, 25, 15)
-            search_mode = st.radio("Search Mode", ["Enhanced", "Standard"]) if ENHANCED_FEATURES_AVAILABLE else "Standard"
-            include_images = st.checkbox("Include images", value=True)
-            include_trends = st.checkbox("Include trend analysis", value=True)
-            summary_type = st.selectbox("Summary type", ["comprehensive", "detailed", "brief"])
-            st.info("🔬 Advanced mode: Comprehensive analysis with detailed insights")
-        
-        enable_visualizations = st.checkbox("Enable charts", value=True)
-        
-        # NEW: Output Format Options
-        st.subheader("📋 Output Format")
-        detailed_formatting = st.checkbox("📝 ChatGPT-style detailed formatting", value=True, help="Bullet points, headings, tables, structured analysis")
-        include_tables = st.checkbox("📊 Include data tables", value=True)
-        include_bullet_points = st.checkbox("• Enhanced bullet points", value=True)
+        sidebar_settings = sidebar_controls()
+    
+    search_speed = sidebar_settings['search_speed']
+    num_results = sidebar_settings['num_results']
+    search_mode = sidebar_settings['search_mode']
+    include_images = sidebar_settings['include_images']
+    include_trends = sidebar_settings['include_trends']
+    summary_type = sidebar_settings['summary_type']
+    detailed_formatting = sidebar_settings['detailed_formatting']
+    include_tables = sidebar_settings['include_tables']
+    include_bullet_points = sidebar_settings['include_bullet_points']
     
     # Main content
     col1, col2 = st.columns([3, 1])
@@ -371,10 +395,11 @@ def main():
             ("⚕️ Medical research", "Medical research"), 
             ("📱 Technology news", "Technology news")
         ]
+        # on_click runs before the rerun Streamlit already schedules for the click,
+        # so the query box picks up the example without a second forced st.rerun()
         for display_text, example in examples:
-            if st.button(display_text, use_container_width=True):
-                st.session_state.search_query = example
-                st.rerun()
+            st.button(display_text, use_container_width=True, key=f"example_{example}",
+                      on_click=set_search_query, args=(example,))
     
     # Research execution
     if search_button and query:
@@ -383,53 +408,99 @@ def main():
         with st.spinner("🔍 Researching..."):
             progress = st.progress(0)
             status = st.empty()
+            tracker = ThrottledProgress(progress, status)
             
             try:
+                # Trend and image lookups only depend on the query, so start them now
+                # and let them overlap with search, extraction and summarization
+                script_ctx = get_script_run_ctx()
+                enhancement_pool = ThreadPoolExecutor(
+                    max_workers=2,
+                    initializer=lambda: add_script_run_ctx(threading.current_thread(), script_ctx)
+                )
+                enhancement_futures = {}
+                
+                if include_trends and HISTORICAL_DATA_AVAILABLE:
+                    analyzer = get_historical_analyzer()
+                    if "stock" in query.lower() or "market" in query.lower():
+                        enhancement_futures['historical_data'] = enhancement_pool.submit(safe_api_call, analyzer.get_stock_trends, 'AAPL', '1y')
+                    else:
+                        enhancement_futures['historical_data'] = enhancement_pool.submit(safe_api_call, analyzer.get_market_trends, 'S&P500', '1y')
+                
+                if include_images and IMAGE_PROCESSING_AVAILABLE:
+                    processor = get_image_processor()
+                    enhancement_futures['image_results'] = enhancement_pool.submit(safe_api_call, processor.search_high_quality_images, query, 5)
+                
+                enhancement_pool.shutdown(wait=False)
+                
                 # Step 1: Search
-                status.text("🔍 Searching for information...")
-                progress.progress(20)
+                tracker.set(20, "🔍 Searching for information...")
                 
-                if search_mode == "Enhanced" and ENHANCED_FEATURES_AVAILABLE:
-                    enhanced_search = EnhancedSearchEngine()
-                    search_results = safe_api_call(enhanced_search.fast_search_and_analyze, query, num_results)
-                else:
-                    search_engine = WebSearchEngine()
-                    search_results = safe_api_call(search_engine.search, query, num_results)
+                try:
+                    search_results = cached_search(query, num_results, search_mode)
+                except Exception as e:
+                    logger.error("Search failed: %s", e)
+                    # Same error dict safe_api_call returns, so consumers see the usual shapes
+                    search_results = {"error": str(e), "success": False}
                 
-                progress.progress(40)
+                # Normalize once: engines return either a bare list or a dict wrapping one.
+                # Every display/export function reads the stored 'search_results_list'.
+                if isinstance(search_results, list):
+                    results_list = search_results
+                elif isinstance(search_results, dict) and not search_results.get('error'):
+                    results_list = search_results.get('search_results', [])
+                else:
+                    results_list = []
                 
                 # Step 2: Content extraction
-                status.text("📄 Extracting content...")
+                tracker.set(40, "📄 Extracting content...")
                 extracted_content = []
                 
-                if search_results and (not isinstance(search_results, dict) or not search_results.get('error')):
-                    extractor = ContentExtractor()
-                    results_list = search_results if isinstance(search_results, list) else search_results.get('search_results', [])
+                urls = [result.get('url') for result in results_list[:5] if result.get('url')]
+                if urls:
+                    # Fetch pages concurrently; order is restored afterwards so
+                    # extracted content still follows search ranking
+                    executor = get_extraction_pool()
+                    futures = {executor.submit(run_in_script_ctx, script_ctx, cached_extract, url): i for i, url in enumerate(urls)}
+                    extracted = [None] * len(urls)
+                    try:
+                        for future in as_completed(futures, timeout=Config.SEARCH_TIMEOUT):
+                            try:
+                                extracted[futures[future]] = future.result()
+                            except Exception as e:
+                                logger.error("Content extraction failed: %s", e)
+                    except FuturesTimeoutError:
+                        logger.warning(f"Content extraction timed out after {Config.SEARCH_TIMEOUT}s; using completed pages")
+                    finally:
+                        # The pool is shared across runs, so drop only this run's pending fetches
+                        for future in futures:
+                            future.cancel()
                     
-                    for result in results_list[:5]:
-                        content = safe_api_call(extractor.extract_from_url, result.get('url', ''))
-                        if content and content.get('success'):
-                            extracted_content.append(content)
-                
-                progress.progress(60)
+                    extracted_content = [content for content in extracted if content and content.get('success')]
                 
                 # Step 3: AI Summarization
-                status.text("🧠 Generating AI summary...")
+                tracker.set(60, "🧠 Generating AI summary...")
+                
+                # Search snippets feed Quick mode and every fallback, so build them once
+                # with the current mode's budget
+                max_snippets, snippet_chars, snippet_total = QUICK_SNIPPET_BUDGET if "Quick" in search_speed else ADVANCED_SNIPPET_BUDGET
+                snippet_text = bounded_join(
+                    (result.get('snippet') for result in islice(results_list, max_snippets)), snippet_chars, snippet_total
+                )
                 
                 # Prepare content based on search speed
                 if "Quick" in search_speed:
                     # Quick mode: Use search snippets primarily
-                    search_text = " ".join([result.get('snippet', '')[:300] for result in results_list[:5]])[:2000]
-                    combined_text = search_text
+                    combined_text = snippet_text
                 else:
                     # Advanced mode: Use full extracted content
-                    combined_text = " ".join([content.get('content', '')[:1500] for content in extracted_content])[:5000]
+                    combined_text = bounded_join((content.get('content') for content in extracted_content), 1500, 5000)
                     if not combined_text:  # Fallback to search snippets
-                        combined_text = " ".join([result.get('snippet', '')[:500] for result in results_list[:8]])[:3000]
+                        combined_text = snippet_text
                 
                 if combined_text:
                     try:
-                        summarizer = AISummarizer()
+                        summarizer = get_summarizer()
                         
                         # Enhanced summarization with formatting options
                         summary_options = {
@@ -456,11 +527,10 @@ def main():
                         }
                 else:
                     # Fallback: summarize search results snippets
-                    search_text = " ".join([result.get('snippet', '') for result in results_list[:5]])[:2000]
-                    if search_text:
+                    if snippet_text:
                         try:
-                            summarizer = AISummarizer()
-                            summary = summarizer.summarize_content(search_text, query)
+                            summarizer = get_summarizer()
+                            summary = summarizer.summarize_content(snippet_text, query)
                         except Exception as e:
                             summary = {
                                 "summary": f"Search completed for '{query}' with {len(results_list)} results found. Detailed information is available in the Sources section.",
@@ -474,33 +544,28 @@ def main():
                             "provider": "Basic"
                         }
                 
-                progress.progress(80)
+                tracker.set(80)
                 
-                # Step 4: Enhanced features
+                # Step 4: Enhanced features (already running in the background)
                 historical_data = None
                 image_results = None
                 
-                if include_trends and HISTORICAL_DATA_AVAILABLE:
-                    status.text("📈 Analyzing trends...")
-                    analyzer = HistoricalDataAnalyzer()
-                    if "stock" in query.lower() or "market" in query.lower():
-                        historical_data = safe_api_call(analyzer.get_stock_trends, 'AAPL', '1y')
-                    else:
-                        historical_data = safe_api_call(analyzer.get_market_trends, 'S&P500', '1y')
+                if 'historical_data' in enhancement_futures:
+                    tracker.set(80, "📈 Analyzing trends...")
+                    historical_data = enhancement_futures['historical_data'].result()
                 
-                if include_images and IMAGE_PROCESSING_AVAILABLE:
-                    status.text("🖼️ Finding images...")
-                    processor = EnhancedImageProcessor()
-                    image_results = safe_api_call(processor.search_high_quality_images, query, 5)
+                if 'image_results' in enhancement_futures:
+                    tracker.set(80, "🖼️ Finding images...")
+                    image_results = enhancement_futures['image_results'].result()
                 
-                progress.progress(100)
-                status.text("✅ Research completed!")
+                tracker.set(100)
                 
                 # Store comprehensive results
-                st.session_state.research_results = {
+                results: ResearchResults = {
                     'query': query,
                     'search_results': search_results,
-                    'extracted_content': extracted_content,
+                    'search_results_list': results_list,
+                    'extracted_content': compact_extracted_content(extracted_content),
                     'summary': summary,
                     'historical_data': historical_data,
                     'image_results': image_results,
@@ -517,6 +582,11 @@ def main():
                         'include_bullet_points': include_bullet_points
                     }
                 }
+                st.session_state.research_results = results
+                
+                # New results start every paginated list back on its first page
+                for key in PAGE_STATE_KEYS:
+                    st.session_state.pop(key, None)
                 
                 # Add to history
                 st.session_state.research_history.append({
@@ -525,9 +595,10 @@ def main():
                     'mode': search_mode
                 })
                 
-                time.sleep(1)
+                # Leave the completion notice in place instead of pausing to show it;
+                # the next rerun clears it
                 progress.empty()
-                status.empty()
+                status.success("✅ Research completed!")
                 
             except Exception as e:
                 st.error(f"❌ Research failed: {str(e)}")
@@ -537,6 +608,7 @@ def main():
     if st.session_state.research_results:
         display_comprehensive_results(st.session_state.research_results)
 
+@fragment
 def display_comprehensive_results(results):
     """Display comprehensive research results with all original features"""
     
@@ -544,27 +616,31 @@ def display_comprehensive_results(results):
     st.header(f"📊 Research Results: \"{results['query']}\"")
     
     # Enhanced metrics with interactive cards
-    col1, col2, col3, col4, col5 = st.columns(5)
-    
     metrics = [
         ("Sources", len(results.get('extracted_content', [])), "📚", "#4facfe"),
-        ("Results", len(results.get('search_results', [])) if isinstance(results.get('search_results'), list) else len(results.get('search_results', {}).get('search_results', [])), "🔍", "#667eea"),
+        ("Results", len(results.get('search_results_list', [])), "🔍", "#667eea"),
         ("Mode", "⚡ Quick" if "Quick" in results.get('search_speed', '') else "🔬 Advanced", "🎯", "#764ba2"),
         ("Engine", results.get('mode', 'Standard'), "⚙️", "#fc4a1a"),
         ("Time", results['timestamp'].strftime('%H:%M:%S'), "⏰", "#00f2fe")
     ]
     
-    for i, (col, (label, value, icon, color)) in enumerate(zip([col1, col2, col3, col4, col5], metrics)):
-        with col:
-            st.markdown(f'''
-            <div class="metric-container" style="background: linear-gradient(135deg, {color}15 0%, {color}05 100%); border-left: 4px solid {color};">
-                <div style="text-align: center;">
-                    <div style="font-size: 2rem; margin-bottom: 0.5rem;">{icon}</div>
-                    <div style="font-size: 1.5rem; font-weight: bold; color: {color};">{value}</div>
-                    <div style="color: #666; font-size: 0.9rem;">{label}</div>
-                </div>
+    # One grid element instead of five columns with a markdown call each
+    cards = "".join(
+        f'''
+        <div class="metric-container" style="background: linear-gradient(135deg, {color}15 0%, {color}05 100%); border-left: 4px solid {color};">
+            <div style="text-align: center;">
+                <div style="font-size: 2rem; margin-bottom: 0.5rem;">{icon}</div>
+                <div style="font-size: 1.5rem; font-weight: bold; color: {color};">{value}</div>
+                <div style="color: #666; font-size: 0.9rem;">{label}</div>
             </div>
-            ''', unsafe_allow_html=True)
+        </div>
+        '''
+        for label, value, icon, color in metrics
+    )
+    st.markdown(
+        f'<div style="display: grid; grid-template-columns: repeat(5, 1fr); gap: 1rem;">{cards}</div>',
+        unsafe_allow_html=True
+    )
     
     # Main content tabs - FULL FUNCTIONALITY RESTORED
     tab1, tab2, tab3, tab4, tab5 = st.tabs(["📝 Summary", "🔍 Sources", "🖼️ Images", "📈 Trends", "📄 Export"])
@@ -715,30 +791,69 @@ def display_summary_section(results):
             **Result**: Reliable AI summaries with structured formatting!
             """)
 
+# Static help text, built once at import instead of on every rerun
+QUICK_SEARCH_TIPS_MD = (
+    "💡 **Quick Search Tips:**\n- Try more specific keywords\n"
+    "- Switch to Advanced Search for broader coverage\n- Check your internet connection"
+)
+TROUBLESHOOTING_TIPS_MD = (
+    "💡 **Troubleshooting:**\n- Refine your search query\n- Try different keywords\n"
+    "- Check your internet connection\n- Some topics may have limited online sources"
+)
+EXPORT_TIPS_MD = (
+    "- **PDF**: Best for sharing complete research reports\n"
+    "- **Markdown**: Great for documentation and GitHub\n"
+    "- **JSON**: Perfect for developers and data analysis\n"
+    "- **CSV**: Ideal for spreadsheet analysis of sources"
+)
+
+# Sources/content lists render this many cards per page
+SOURCES_PAGE_SIZE = 5
+PAGE_STATE_KEYS = ('compact_page', 'cards_page', 'content_page')
+
+def set_page(state_key, page):
+    """Pagination button callback"""
+    st.session_state[state_key] = page
+
+def paginate(items, state_key, page_size):
+    """Render prev/next controls and return (first item number, items on the current page)"""
+    pages = max(1, -(-len(items) // page_size))
+    page = min(st.session_state.get(state_key, 0), pages - 1)
+    
+    if pages > 1:
+        col_prev, col_info, col_next = st.columns([1, 2, 1])
+        col_prev.button("⬅️ Previous", key=f"{state_key}_prev", disabled=page == 0,
+                        on_click=set_page, args=(state_key, page - 1))
+        col_info.caption(f"Page {page + 1} of {pages}")
+        col_next.button("Next ➡️", key=f"{state_key}_next", disabled=page >= pages - 1,
+                        on_click=set_page, args=(state_key, page + 1))
+    
+    start = page * page_size
+    return start + 1, items[start:start + page_size]
+
 def display_sources_section(results):
     """Display enhanced sources information with tables and structured data"""
     search_results = results.get('search_results', [])
     extracted_content = results.get('extracted_content', [])
     settings = results.get('settings', {})
     
-    # Handle different result formats
-    if isinstance(search_results, dict):
-        sources_list = search_results.get('search_results', [])
-        if search_results.get('search_time'):
-            st.info(f"⚡ Search completed in {search_results['search_time']} seconds")
-    else:
-        sources_list = search_results
+    sources_list = results.get('search_results_list', [])
+    if isinstance(search_results, dict) and search_results.get('search_time'):
+        st.info(f"⚡ Search completed in {search_results['search_time']} seconds")
     
     # Enhanced overview with data table
     st.subheader("📊 Sources Overview")
     
+    sources_count = len(sources_list)
+    extracted_count = len(extracted_content)
+    domains = list(dict.fromkeys(source.get('domain', 'Unknown') for source in sources_list))
+    
     col1, col2, col3, col4 = st.columns(4)
     with col1:
-        st.metric("🔍 Search Results", len(sources_list))
+        st.metric("🔍 Search Results", sources_count)
     with col2:
-        st.metric("📄 Content Extracted", len(extracted_content))
+        st.metric("📄 Content Extracted", extracted_count)
     with col3:
-        domains = list(set([source.get('domain', 'Unknown') for source in sources_list]))
         st.metric("🌐 Unique Domains", len(domains))
     with col4:
         search_speed = results.get('search_speed', '')
@@ -752,67 +867,62 @@ def display_sources_section(results):
             ["📋 Detailed Cards", "📊 Data Table", "📝 Compact List"]
         )
         
+        # Card and list views share one cached set of truncated fields
+        sources_view = prepare_sources_view(sources_list[:15])
+        
         if display_format == "📊 Data Table" and settings.get('include_tables', True):
             # Create data table
-            table_data = []
-            for i, source in enumerate(sources_list[:20], 1):
-                table_data.append({
-                    "#": i,
-                    "Title": source.get('title', 'Untitled')[:60] + ('...' if len(source.get('title', '')) > 60 else ''),
-                    "Domain": source.get('domain', 'Unknown'),
-                    "Relevance": f"{source.get('score', 0.8):.1f}/1.0" if source.get('score') else "High",
-                    "Type": source.get('source', 'Web')
-                })
-            
-            df = pd.DataFrame(table_data)
+            df = build_sources_table(sources_list[:20])
             st.dataframe(df, use_container_width=True, hide_index=True)
             
             # Download table option
-            csv = df.to_csv(index=False)
+            table_csv = build_sources_table_csv(sources_list[:20])
             st.download_button(
                 "📥 Download Sources Table (CSV)",
-                csv,
+                table_csv,
                 file_name=f"sources_{results['query'][:20]}_{datetime.now().strftime('%Y%m%d_%H%M')}.csv",
                 mime="text/csv"
             )
             
         elif display_format == "📝 Compact List":
             # Compact list view
-            for i, source in enumerate(sources_list[:15], 1):
+            start, page_sources = paginate(sources_view, 'compact_page', SOURCES_PAGE_SIZE)
+            for i, source in enumerate(page_sources, start):
                 col1, col2 = st.columns([3, 1])
                 with col1:
-                    st.markdown(f"**{i}.** [{source.get('title', 'Untitled')[:80]}]({source.get('url', '#')})")
-                    st.caption(f"🌐 {source.get('domain', 'Unknown')} | {source.get('snippet', 'No description')[:100]}...")
+                    st.markdown(f"**{i}.** [{source['title']}]({source['link']})")
+                    st.caption(f"🌐 {source['domain']} | {source['snippet_short']}...")
                 with col2:
-                    if source.get('score'):
+                    if source['score']:
                         st.metric("Relevance", f"{source['score']:.2f}")
-                    st.caption(f"📄 {source.get('source', 'Web')}")
+                    st.caption(f"📄 {source['source'] or 'Web'}")
         
         else:  # Detailed Cards (default)
-            st.subheader(f"🔍 Search Sources ({len(sources_list)} found)")
+            st.subheader(f"🔍 Search Sources ({sources_count} found)")
             
-            for i, source in enumerate(sources_list[:15], 1):
-                with st.expander(f"{i}. {source.get('title', 'Untitled')[:80]}..."):
+            start, page_sources = paginate(sources_view, 'cards_page', SOURCES_PAGE_SIZE)
+            for i, source in enumerate(page_sources, start):
+                with st.expander(f"{i}. {source['title']}..."):
                     col1, col2 = st.columns([3, 1])
                     
                     with col1:
-                        st.markdown(f"**🔗 URL:** [{source.get('url', 'N/A')}]({source.get('url', '#')})")
-                        st.markdown(f"**📝 Description:** {source.get('snippet', 'No description available')[:400]}...")
-                        if source.get('domain'):
+                        st.markdown(f"**🔗 URL:** [{source['url']}]({source['link']})")
+                        st.markdown(f"**📝 Description:** {source['snippet']}...")
+                        if source['has_domain']:
                             st.markdown(f"**🌐 Domain:** {source['domain']}")
                     
                     with col2:
-                        if source.get('score'):
+                        if source['score']:
                             st.metric("🎯 Relevance", f"{source['score']:.2f}/1.0")
-                        if source.get('source'):
+                        if source['source']:
                             st.caption(f"🔍 Engine: {source['source']}")
-                        if source.get('date'):
+                        if source['date']:
                             st.caption(f"📅 Date: {source['date']}")
     
     # Enhanced extracted content display
     if extracted_content:
         st.markdown("---")
-        st.subheader(f"📄 Extracted Content ({len(extracted_content)} sources)")
+        st.subheader(f"📄 Extracted Content ({extracted_count} sources)")
         
         content_format = st.radio(
             "Content Display:",
@@ -830,11 +940,13 @@ def display_sources_section(results):
                     "Content Preview": content.get('text', '')[:100] + '...' if content.get('text') else 'No content'
                 })
             
+            import pandas as pd
             content_df = pd.DataFrame(content_table)
             st.dataframe(content_df, use_container_width=True, hide_index=True)
         
         else:  # Full content display
-            for i, content in enumerate(extracted_content[:10], 1):
+            start, page_content = paginate(extracted_content[:10], 'content_page', SOURCES_PAGE_SIZE)
+            for i, content in enumerate(page_content, start):
                 with st.expander(f"Content {i}: {content.get('title', 'Untitled')[:60]}..."):
                     if content.get('content'):
                         text = content['content'][:1200]
@@ -854,59 +966,116 @@ def display_sources_section(results):
         st.warning("🚨 No sources found")
         search_speed = results.get('search_speed', '')
         if 'Quick' in search_speed:
-            st.info("💡 **Quick Search Tips:**\n- Try more specific keywords\n- Switch to Advanced Search for broader coverage\n- Check your internet connection")
+            st.info(QUICK_SEARCH_TIPS_MD)
         else:
-            st.info("💡 **Troubleshooting:**\n- Refine your search query\n- Try different keywords\n- Check your internet connection\n- Some topics may have limited online sources")
+            st.info(TROUBLESHOOTING_TIPS_MD)
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def prepare_sources_view(sources):
+    """Truncated card/list fields for each source, computed once per result set"""
+    return [
+        {
+            'title': (source.get('title') or 'Untitled')[:80],
+            'snippet': (source.get('snippet') or 'No description available')[:400],
+            'snippet_short': (source.get('snippet') or 'No description')[:100],
+            'url': source.get('url', 'N/A'),
+            'link': source.get('url', '#'),
+            'domain': source.get('domain') or 'Unknown',
+            'has_domain': bool(source.get('domain')),
+            'score': source.get('score'),
+            'source': source.get('source'),
+            'date': source.get('date')
+        }
+        for source in sources
+    ]
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def build_sources_table(sources):
+    """Sources overview DataFrame, memoized so tab reruns skip rebuilding it"""
+    import pandas as pd  # deferred: only the table views need pandas
+    
+    # Build the frame in one go and derive display columns with vectorized ops
+    df = pd.DataFrame.from_records(sources, columns=['title', 'domain', 'score', 'source'])
+    titles = df['title'].fillna('Untitled').astype(str)
+    short_titles = titles.str[:60]
+    scores = pd.to_numeric(df['score'], errors='coerce')
+    
+    return pd.DataFrame({
+        "#": range(1, len(df) + 1),
+        "Title": short_titles.where(titles.str.len() <= 60, short_titles + '...'),
+        "Domain": df['domain'].fillna('Unknown'),
+        "Relevance": scores.map('{:.1f}/1.0'.format).where(scores.notna() & (scores != 0), 'High'),
+        "Type": df['source'].fillna('Web')
+    })
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def build_sources_table_csv(sources):
+    """Sources overview table as CSV text, written row by row with csv.writer"""
+    df = build_sources_table(sources)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(df.columns)
+    writer.writerows(df.itertuples(index=False, name=None))
+    return buffer.getvalue()
+
+def is_displayable_image_url(url):
+    """Cheap check that st.image can load this URL, so bad entries are skipped up front"""
+    return isinstance(url, str) and (
+        url.startswith('data:image/') or
+        (url.startswith(('http://', 'https://')) and bool(urlparse(url).netloc))
+    )
 
 def display_images_section(results):
     """Display images with comprehensive analysis"""
     image_results = results.get('image_results')
-    search_results = results.get('search_results', [])
     
-    # Check for enhanced image results
+    # Normalize enhanced image results and search-result images into one shape
     if image_results and image_results.get('success'):
-        st.subheader(f"🖼️ Enhanced Images ({image_results.get('total_found', 0)} found)")
-        
-        images = image_results.get('images', [])
-        cols_per_row = 3
-        for i in range(0, len(images), cols_per_row):
-            cols = st.columns(cols_per_row)
-            for j, col in enumerate(cols):
-                idx = i + j
-                if idx < len(images):
-                    img = images[idx]
-                    with col:
-                        if img.get('thumbnail'):
-                            try:
-                                st.image(img['thumbnail'], caption=img.get('title', 'Image')[:50], use_column_width=True)
-                            except:
-                                st.write(f"🖼️ {img.get('title', 'Image')}")
-                        st.caption(f"Source: {img.get('source', 'Unknown')}")
-                        if img.get('quality_score'):
-                            st.caption(f"Quality: {img['quality_score']}/10")
-    
-    # Fall back to search result images
+        heading = f"🖼️ Enhanced Images ({image_results.get('total_found', 0)} found)"
+        images = [
+            {
+                'url': img.get('thumbnail'),
+                'title': img.get('title', 'Image'),
+                'source': img.get('source', 'Unknown'),
+                'quality_score': img.get('quality_score')
+            }
+            for img in image_results.get('images', [])
+        ]
     else:
-        if isinstance(search_results, dict):
-            results_list = search_results.get('search_results', [])
-        else:
-            results_list = search_results
-        
-        image_urls = [r for r in results_list if r.get('image_url') or r.get('result_type') == 'image']
+        results_list = results.get('search_results_list', [])
         
-        if image_urls:
-            st.subheader(f"🖼️ Search Images ({len(image_urls)} found)")
-            cols = st.columns(3)
-            for i, img in enumerate(image_urls[:9]):
-                with cols[i % 3]:
-                    img_url = img.get('image_url') or img.get('url')
-                    if img_url:
-                        try:
-                            st.image(img_url, caption=img.get('title', 'Image')[:40], use_column_width=True)
-                        except:
-                            st.write(f"🖼️ {img.get('title', 'Image')}")
-        else:
-            st.info("🖼️ No images found. Try enabling image search or use a more visual query.")
+        images = [
+            {
+                'url': r.get('image_url') or r.get('url'),
+                'title': r.get('title', 'Image'),
+                'source': r.get('source'),
+                'quality_score': None
+            }
+            for r in results_list if r.get('image_url') or r.get('result_type') == 'image'
+        ]
+        heading = f"🖼️ Search Images ({len(images)} found)"
+        images = images[:9]
+    
+    if not images:
+        st.info("🖼️ No images found. Try enabling image search or use a more visual query.")
+        return
+    
+    st.subheader(heading)
+    # Render the whole gallery with a single st.image call instead of one element per image
+    gallery = [img for img in images if is_displayable_image_url(img['url'])]
+    if gallery:
+        st.image([img['url'] for img in gallery], caption=[img['title'][:50] for img in gallery], width=220)
+    
+    skipped = len(images) - len(gallery)
+    if skipped:
+        st.caption(f"⚠️ {skipped} images could not be displayed")
+    
+    details = [
+        f"{i}. {img['source']}" + (f" (Quality: {img['quality_score']}/10)" if img['quality_score'] else "")
+        for i, img in enumerate(gallery, 1) if img['source']
+    ]
+    if details:
+        st.caption("Sources: " + " | ".join(details))
 
 def display_trends_section(results):
     """Display trend analysis and historical data"""
@@ -937,30 +1106,32 @@ def display_trends_section(results):
             st.markdown(historical_data['summary'])
     
     # Basic trend analysis from sources
-    search_results = results.get('search_results', [])
-    if isinstance(search_results, dict):
-        sources = search_results.get('search_results', [])
-    else:
-        sources = search_results
-    
+    sources = results.get('search_results_list', [])
     if sources:
         st.subheader("📊 Source Distribution")
         domains = [s.get('domain', 'Unknown') for s in sources if s.get('domain')]
         if domains:
-            domain_counts = pd.Series(domains).value_counts().head(8)
-            fig = px.bar(x=domain_counts.values, y=domain_counts.index, orientation='h', 
-                        title='Top Source Domains', labels={'x': 'Count', 'y': 'Domain'})
-            fig.update_layout(height=300)
-            st.plotly_chart(fig, use_container_width=True)
+            # A handful of bars renders fine with Streamlit's built-in Vega-Lite chart,
+            # so this tab doesn't need Plotly at all
+            import pandas as pd
+            
+            labels, values = zip(*Counter(domains).most_common(8))
+            st.caption("Top Source Domains")
+            chart_df = pd.DataFrame({'Count': values}, index=pd.Index(labels, name='Domain'))
+            st.bar_chart(chart_df, height=300, use_container_width=True)
 
 def display_export_section(results):
     """Display comprehensive export options"""
     st.subheader("📥 Export Research Results")
     
-    # Show export readiness status
-    summary_available = results.get('summary', {}).get('success', False)
-    sources_available = len(results.get('search_results', {}).get('search_results', [])) > 0 if isinstance(results.get('search_results'), dict) else len(results.get('search_results', [])) > 0
-    content_available = len(results.get('extracted_content', [])) > 0
+    # Check export readiness once, and bail out before rendering any status widgets
+    summary_available = bool((results.get('summary') or {}).get('success'))
+    sources_available = bool(results.get('search_results_list'))
+    content_available = bool(results.get('extracted_content'))
+    
+    if not (summary_available or sources_available or content_available):
+        st.warning("⚠️ No content available for export. Please run a search first.")
+        return
     
     col1, col2, col3 = st.columns(3)
     with col1:
@@ -970,139 +1141,123 @@ def display_export_section(results):
     with col3:
         st.metric("📄 Content", "✅ Ready" if content_available else "❌ None")
     
-    if not (summary_available or sources_available or content_available):
-        st.warning("⚠️ No content available for export. Please run a search first.")
-        return
-    
     st.divider()
     
+    # Exports are cached per research run, so reruns of this tab reuse them without
+    # re-serializing the results; the caches keep only the 16 most recent runs
+    export_id = results_export_id(results)
+    md_content = cached_markdown_export(export_id, results)
+    csv_content = cached_csv_export(export_id, results)
+    json_data = cached_json_export(export_id, results)
+    
+    # Shared query/timestamp part of every export file name
+    file_stem = f"{results['query'][:30]}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    
     col1, col2 = st.columns(2)
     
     with col1:
         st.markdown("**📄 Document Formats:**")
         
-        # PDF Export
+        # PDF Export (expensive, so still generated on demand)
         if st.button("📄 Export as PDF", use_container_width=True):
-            try:
-                with st.spinner("Generating comprehensive PDF report..."):
-                    pdf_gen = PDFGenerator()
-                    pdf_content = pdf_gen.generate_pdf(results)
-                    
-                    if isinstance(pdf_content, bytes) and len(pdf_content) > 0:
-                        st.download_button(
-                            "📥 Download PDF Report",
-                            pdf_content,
-                            file_name=f"research_{results['query'][:30]}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf",
-                            mime="application/pdf",
-                            use_container_width=True
-                        )
-                        st.success("✅ PDF report ready for download!")
-                        st.info(f"📋 Report includes: {'Summary, ' if summary_available else ''}Sources{', Content' if content_available else ''}")
-                    else:
-                        st.error("❌ PDF generation failed - Invalid content")
-            except Exception as e:
-                st.error(f"PDF export error: {str(e)}")
-                st.info("💡 Tip: Try a simpler query or check your API configuration")
-        
-        # Markdown Export
-        if st.button("📝 Export as Markdown", use_container_width=True):
-            try:
-                md_content = generate_markdown_export(results)
+            with st.spinner("Generating comprehensive PDF report..."):
+                try:
+                    pdf_content = cached_pdf_export(export_id, results)
+                except Exception as e:
+                    logger.error(f"PDF export error: {str(e)}")
+                    pdf_content = None
+            
+            if isinstance(pdf_content, bytes) and len(pdf_content) > 0:
                 st.download_button(
-                    "📥 Download Markdown",
-                    md_content,
-                    file_name=f"research_{results['query'][:30]}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md",
-                    mime="text/markdown",
+                    "📥 Download PDF Report",
+                    pdf_content,
+                    file_name=f"research_{file_stem}.pdf",
+                    mime="application/pdf",
                     use_container_width=True
                 )
-                st.success("✅ Markdown ready for download!")
-            except Exception as e:
-                st.error(f"Markdown export error: {str(e)}")
-    
+                st.success("✅ PDF report ready for download!")
+                st.info(f"📋 Report includes: {'Summary, ' if summary_available else ''}Sources{', Content' if content_available else ''}")
+            else:
+                st.error("❌ PDF generation failed - Invalid content")
+                st.info("💡 Tip: Try a simpler query or check your API configuration")
+        
+        # Markdown Export
+        st.download_button(
+            "📝 Download Markdown",
+            md_content,
+            file_name=f"research_{file_stem}.md",
+            mime="text/markdown",
+            use_container_width=True
+        )
         
     with col2:
         st.markdown("**📊 Data Formats:**")
         
         # JSON Export
-        if st.button("📊 Export as JSON", use_container_width=True):
-            try:
-                json_data = json.dumps(results, indent=2, default=str)
-                st.download_button(
-                    "📥 Download JSON",
-                    json_data,
-                    file_name=f"research_{results['query'][:30]}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
-                    mime="application/json",
-                    use_container_width=True
-                )
-                st.success("✅ JSON data ready!")
-            except Exception as e:
-                st.error(f"JSON export error: {str(e)}")
+        st.download_button(
+            "📊 Download JSON",
+            json_data,
+            file_name=f"research_{file_stem}.json",
+            mime="application/json",
+            use_container_width=True
+        )
         
         # CSV Export
-        if st.button("📈 Export Sources CSV", use_container_width=True):
-            try:
-                csv_content = generate_csv_export(results)
-                st.download_button(
-                    "📥 Download CSV",
-                    csv_content,
-                    file_name=f"sources_{results['query'][:30]}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                    mime="text/csv",
-                    use_container_width=True
-                )
-                st.success("✅ CSV data ready!")
-            except Exception as e:
-                st.error(f"CSV export error: {str(e)}")
+        st.download_button(
+            "📈 Download Sources CSV",
+            csv_content,
+            file_name=f"sources_{file_stem}.csv",
+            mime="text/csv",
+            use_container_width=True
+        )
     
     # Show export tips
     with st.expander("💡 Export Tips"):
-        st.markdown("""
-        - **PDF**: Best for sharing complete research reports
-        - **Markdown**: Great for documentation and GitHub
-        - **JSON**: Perfect for developers and data analysis
-        - **CSV**: Ideal for spreadsheet analysis of sources
-        """)
+        st.markdown(EXPORT_TIPS_MD)
 
 def generate_markdown_export(results):
     """Generate comprehensive markdown export"""
     try:
-        md = f"# Research Report: {results.get('query', 'Unknown Query')}\n\n"
-        md += f"**Generated:** {results.get('timestamp', datetime.now().isoformat())}\n"
-        md += f"**Mode:** {results.get('mode', 'Standard')}\n\n"
+        # Collect sections in a list and join once instead of growing a string
+        parts = [
+            f"# Research Report: {results.get('query', 'Unknown Query')}\n\n",
+            f"**Generated:** {results.get('timestamp', datetime.now().isoformat())}\n",
+            f"**Mode:** {results.get('mode', 'Standard')}\n\n"
+        ]
         
         # Summary
         summary = results.get('summary', {})
         if summary and summary.get('success'):
-            md += "## Summary\n\n"
-            md += summary.get('summary', 'No summary available') + "\n\n"
-            md += f"*Generated by: {summary.get('provider', 'AI System')}*\n\n"
+            parts.append("## Summary\n\n")
+            parts.append(summary.get('summary', 'No summary available') + "\n\n")
+            parts.append(f"*Generated by: {summary.get('provider', 'AI System')}*\n\n")
         
         # AI Summaries (if available)
         summaries = results.get('summaries', {})
         if isinstance(summaries, dict):
             if summaries.get('executive_summary'):
-                md += "## Executive Summary\n\n"
-                md += summaries['executive_summary'] + "\n\n"
+                parts.append("## Executive Summary\n\n")
+                parts.append(summaries['executive_summary'] + "\n\n")
             
             if summaries.get('key_findings'):
-                md += "## Key Findings\n\n"
-                for i, finding in enumerate(summaries['key_findings'], 1):
-                    md += f"{i}. {finding}\n"
-                md += "\n"
+                parts.append("## Key Findings\n\n")
+                parts.extend(f"{i}. {finding}\n" for i, finding in enumerate(summaries['key_findings'], 1))
+                parts.append("\n")
         
         # Sources
-        search_results = results.get('search_results', [])
-        sources = search_results if isinstance(search_results, list) else search_results.get('search_results', [])
+        sources = results.get('search_results_list', [])
         if sources:
-            md += "## Sources\n\n"
+            parts.append("## Sources\n\n")
+            get = dict.get
             for i, source in enumerate(sources[:10], 1):
-                title = source.get('title', 'Untitled')
-                url = source.get('url', 'N/A')
-                snippet = source.get('snippet', 'No description')[:200]
-                md += f"{i}. **{title}**\n"
-                md += f"   - URL: {url}\n"
-                md += f"   - Description: {snippet}...\n\n"
+                title, url, snippet = (
+                    get(source, 'title', 'Untitled'),
+                    get(source, 'url', 'N/A'),
+                    (get(source, 'snippet') or 'No description')[:200],
+                )
+                parts.append(f"{i}. **{title}**\n   - URL: {url}\n   - Description: {snippet}...\n\n")
         
-        return md
+        return "".join(parts)
         
     except Exception as e:
         return f"# Research Report\n\nError generating markdown: {str(e)}\n"
@@ -1110,22 +1265,75 @@ def generate_markdown_export(results):
 def generate_csv_export(results):
     """Generate CSV export for sources"""
     try:
-        search_results = results.get('search_results', [])
-        sources = search_results if isinstance(search_results, list) else search_results.get('search_results', [])
+        sources = results.get('search_results_list', [])
         
-        csv = "Title,URL,Description,Source,Domain\n"
-        for source in sources:
-            title = str(source.get('title', 'Untitled')).replace(',', ';').replace('"', "'")
-            url = str(source.get('url', 'N/A')).replace(',', ';')
-            desc = str(source.get('snippet', 'No description')).replace(',', ';')[:200]
-            src = str(source.get('source', 'Unknown')).replace(',', ';')
-            domain = str(source.get('domain', 'Unknown')).replace(',', ';')
-            csv += f'"{title}","{url}","{desc}","{src}","{domain}"\n'
+        if not sources:
+            return "Title,URL,Description,Source,Domain\nNo sources available,,,,,\n"
         
-        return csv if len(sources) > 0 else "Title,URL,Description,Source,Domain\nNo sources available,,,,,\n"
+        # csv.writer handles quoting of commas, quotes and newlines in field values;
+        # dict.get is bound locally to skip the attribute lookup on every field of every row
+        get = dict.get
+        buf = io.StringIO()
+        writer = csv.writer(buf, quoting=csv.QUOTE_MINIMAL)
+        writer.writerow(["Title", "URL", "Description", "Source", "Domain"])
+        writer.writerows(
+            (
+                get(source, 'title', 'Untitled'),
+                get(source, 'url', 'N/A'),
+                (get(source, 'snippet') or 'No description')[:200],
+                get(source, 'source', 'Unknown'),
+                get(source, 'domain', 'Unknown'),
+            )
+            for source in sources
+        )
+        return buf.getvalue()
         
     except Exception as e:
         return f"Title,URL,Description,Source,Domain\nError generating CSV: {str(e)},,,,\n"
 
+def results_export_id(results):
+    """Stable cache key for one research run: its query and completion timestamp"""
+    return f"{results.get('timestamp')}|{results.get('query')}"
+
+def results_to_json(results):
+    """Serialize results to pretty-printed, key-sorted UTF-8 JSON bytes in one pass"""
+    if ORJSON_AVAILABLE:
+        # Datetimes pass through to default=str so the output matches the json fallback
+        return orjson.dumps(
+            results,
+            default=str,
+            option=(
+                orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+                | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_SERIALIZE_NUMPY
+            )
+        )
+    return json.dumps(results, indent=2, sort_keys=True, default=str, ensure_ascii=False).encode('utf-8')
+
+# The leading underscore keeps st.cache_data from hashing the results themselves;
+# export_id alone identifies the entry
+@st.cache_data(max_entries=16, show_spinner=False)
+def cached_markdown_export(export_id, _results):
+    """Markdown export cached in memory per research run"""
+    return generate_markdown_export(_results)
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def cached_csv_export(export_id, _results):
+    """CSV export cached in memory per research run"""
+    return generate_csv_export(_results)
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def cached_json_export(export_id, _results):
+    """Pretty-printed JSON export (bytes) cached in memory per research run"""
+    return results_to_json(_results)
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def cached_pdf_export(export_id, _results):
+    """PDF report cached in memory per research run"""
+    pdf_content = get_pdf_generator().generate_pdf(_results)
+    # Raising keeps a failed render out of the cache, so the next click retries it
+    if not isinstance(pdf_content, bytes) or not pdf_content:
+        raise ValueError("PDF generator returned no content")
+    return pdf_content
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
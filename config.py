@@ -2,6 +2,8 @@
 Configuration settings for AI Research Agent
 Enhanced for historical data, trends, and image analysis
 """
+import copy
+import functools
 import os
 from dotenv import load_dotenv
 
@@ -57,10 +59,47 @@ class Config:
     REDDIT_CLIENT_SECRET = os.getenv('REDDIT_CLIENT_SECRET')
     REDDIT_USER_AGENT = os.getenv('REDDIT_USER_AGENT', 'AIResearchAgent/1.0')
     
+    # API key formats: (display name, attribute, required prefix[, minimum length])
+    _AI_PROVIDER_KEYS = (
+        ('OpenAI', 'OPENAI_API_KEY', 'sk-'),
+        ('Perplexity', 'PERPLEXITY_API_KEY', 'pplx-'),
+        ('Anthropic', 'ANTHROPIC_API_KEY', 'sk-ant-'),
+        ('Gemini', 'GEMINI_API_KEY', 'AIza'),
+        ('Hugging Face', 'HUGGINGFACE_API_KEY', 'hf_'),
+        ('Cohere', 'COHERE_API_KEY', 'co-'),
+        ('Together AI', 'TOGETHER_API_KEY', 'together_'),
+    )
+    _SEARCH_ENGINE_KEYS = (
+        ('SerpAPI', 'SERPAPI_API_KEY', '', 20),
+        ('Tavily', 'TAVILY_API_KEY', 'tvly-', 0),
+        ('Exa', 'EXA_API_KEY', '', 20),
+        ('SearchAPI', 'SEARCHAPI_KEY', '', 10),
+    )
+    _PLACEHOLDER_CHECKED_KEYS = (
+        ('image_services', 'Unsplash', 'UNSPLASH_ACCESS_KEY'),
+        ('image_services', 'Pixabay', 'PIXABAY_API_KEY'),
+        ('social_media', 'Twitter', 'TWITTER_BEARER_TOKEN'),
+        ('social_media', 'Reddit', 'REDDIT_CLIENT_ID'),
+    )
+    
     # API Key Validation
+    # Environment variables are read once at import, so validation results are
+    # memoized per class. The public getters hand out deep copies so callers can't
+    # alter the memoized dicts; call clear_api_key_cache() after changing keys
+    @classmethod
+    def clear_api_key_cache(cls):
+        """Forget memoized validate_api_keys/get_comprehensive_status results"""
+        cls._cached_api_key_validation.cache_clear()
+        cls._cached_comprehensive_status.cache_clear()
+    
     @classmethod
     def validate_api_keys(cls):
         """Comprehensive API key validation for all services"""
+        return copy.deepcopy(cls._cached_api_key_validation())
+    
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _cached_api_key_validation(cls):
         valid_keys = {
             'ai_providers': [],
             'search_engines': [],
@@ -72,44 +111,19 @@ class Config:
             'total_available': 0
         }
         
-        # Check AI providers - enhanced validation
-        if cls.OPENAI_API_KEY and cls.OPENAI_API_KEY.startswith('sk-'):
-            valid_keys['ai_providers'].append('OpenAI')
-            
-        if cls.PERPLEXITY_API_KEY and cls.PERPLEXITY_API_KEY.startswith('pplx-'):
-            valid_keys['ai_providers'].append('Perplexity')
-            
-        if cls.ANTHROPIC_API_KEY and cls.ANTHROPIC_API_KEY.startswith('sk-ant-'):
-            valid_keys['ai_providers'].append('Anthropic')
-        
-        if cls.GEMINI_API_KEY and cls.GEMINI_API_KEY.startswith('AIza'):  # More specific validation
-            valid_keys['ai_providers'].append('Gemini')
+        # Check AI providers and search engines against their key formats
+        for name, attr, prefix in cls._AI_PROVIDER_KEYS:
+            key = getattr(cls, attr)
+            if key and key.startswith(prefix):
+                valid_keys['ai_providers'].append(name)
         
-        # Check additional free AI providers
-        if cls.HUGGINGFACE_API_KEY and cls.HUGGINGFACE_API_KEY.startswith('hf_'):
-            valid_keys['ai_providers'].append('Hugging Face')
-            
-        if cls.COHERE_API_KEY and cls.COHERE_API_KEY.startswith('co-'):
-            valid_keys['ai_providers'].append('Cohere')
-            
-        if cls.TOGETHER_API_KEY and cls.TOGETHER_API_KEY.startswith('together_'):
-            valid_keys['ai_providers'].append('Together AI')
-            
         if cls.OLLAMA_ENABLED == 'true':
             valid_keys['ai_providers'].append('Ollama (Local)')
         
-        # Check search engines
-        if cls.SERPAPI_API_KEY and len(cls.SERPAPI_API_KEY) > 20:
-            valid_keys['search_engines'].append('SerpAPI')
-            
-        if cls.TAVILY_API_KEY and cls.TAVILY_API_KEY.startswith('tvly-'):
-            valid_keys['search_engines'].append('Tavily')
-            
-        if cls.EXA_API_KEY and len(cls.EXA_API_KEY) > 20:
-            valid_keys['search_engines'].append('Exa')
-            
-        if cls.SEARCHAPI_KEY and len(cls.SEARCHAPI_KEY) > 10:
-            valid_keys['search_engines'].append('SearchAPI')
+        for name, attr, prefix, min_length in cls._SEARCH_ENGINE_KEYS:
+            key = getattr(cls, attr)
+            if key and key.startswith(prefix) and len(key) > min_length:
+                valid_keys['search_engines'].append(name)
         
         # Check historical data sources
         if cls.YFINANCE_ENABLED == 'true':
@@ -126,19 +140,11 @@ class Config:
         if cls.FRED_API_KEY and not cls.FRED_API_KEY.endswith('_here'):
             valid_keys['historical_data'].append('FRED')
         
-        # Check image services
-        if cls.UNSPLASH_ACCESS_KEY and not cls.UNSPLASH_ACCESS_KEY.endswith('_here'):
-            valid_keys['image_services'].append('Unsplash')
-            
-        if cls.PIXABAY_API_KEY and not cls.PIXABAY_API_KEY.endswith('_here'):
-            valid_keys['image_services'].append('Pixabay')
-        
-        # Check social media APIs
-        if cls.TWITTER_BEARER_TOKEN and not cls.TWITTER_BEARER_TOKEN.endswith('_here'):
-            valid_keys['social_media'].append('Twitter')
-            
-        if cls.REDDIT_CLIENT_ID and not cls.REDDIT_CLIENT_ID.endswith('_here'):
-            valid_keys['social_media'].append('Reddit')
+        # Check image services and social media APIs (skip .env placeholders)
+        for category, name, attr in cls._PLACEHOLDER_CHECKED_KEYS:
+            key = getattr(cls, attr)
+            if key and not key.endswith('_here'):
+                valid_keys[category].append(name)
         
         # Calculate totals
         for category in ['ai_providers', 'search_engines', 'historical_data', 'image_services', 'social_media']:
@@ -197,7 +203,12 @@ class Config:
     @classmethod
     def get_comprehensive_status(cls):
         """Get comprehensive status of all API configurations"""
-        validation = cls.validate_api_keys()
+        return copy.deepcopy(cls._cached_comprehensive_status())
+    
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _cached_comprehensive_status(cls):
+        validation = cls._cached_api_key_validation()
         
         status = {
             'overall_health': 'Excellent' if validation['working_count'] > 8 else 
@@ -253,6 +264,13 @@ class Config:
     # Enhanced Features
     ENABLE_REAL_TIME_SEARCH = True
     PARALLEL_AI_PROCESSING = True
+    PREFETCH_FOLLOWUP_SUMMARIES = os.getenv('PREFETCH_FOLLOWUP_SUMMARIES', 'false').lower() == 'true'
+    # Seconds to wait on a summary provider before starting the next one as a backup (0 = strictly one at a time)
+    SUMMARY_HEDGE_SECONDS = float(os.getenv('SUMMARY_HEDGE_SECONDS', 0))
+    # Summarize each source of large (BATCH_SUMMARY_MIN_SOURCES+) source lists first; one API call per source
+    BATCH_SOURCE_SUMMARIES = os.getenv('BATCH_SOURCE_SUMMARIES', 'false').lower() == 'true'
+    # Reuse summaries across reworded queries over the same content (loads an embedding model)
+    SEMANTIC_SUMMARY_CACHE = os.getenv('SEMANTIC_SUMMARY_CACHE', 'false').lower() == 'true'
     FAST_MODE = True
     ENABLE_TREND_ANALYSIS = True
     TREND_WINDOW_DAYS = 365  # Full year for historical analysis
@@ -273,23 +291,3 @@ class Config:
     ENABLE_SOCIAL_SENTIMENT = True
     ENABLE_REAL_TIME_DATA = True
     ENABLE_PARALLEL_PROCESSING = True
-    PARALLEL_REQUESTS = os.getenv('PARALLEL_REQUESTS', 'true').lower() == 'true'
-    MAX_CONCURRENT_REQUESTS = int(os.getenv('MAX_CONCURRENT_REQUESTS', 5))
-    RETRY_ATTEMPTS = int(os.getenv('RETRY_ATTEMPTS', 3))
-    REQUEST_DELAY_MS = int(os.getenv('REQUEST_DELAY_MS', 100))
-    
-    # Enhanced Features
-    ENABLE_REAL_TIME_SEARCH = True
-    PARALLEL_AI_PROCESSING = True
-    FAST_MODE = True
-    ENABLE_TREND_ANALYSIS = True
-    TREND_WINDOW_DAYS = 365  # Full year for historical analysis
-    MIN_TREND_SOURCES = 3
-    
-    # Content Extraction Settings
-    MIN_ARTICLE_LENGTH = 200
-    MAX_ARTICLE_LENGTH = 10000
-    
-    # Export Settings
-    PDF_TITLE = "AI Research Report with Historical Analysis"
-    MARKDOWN_TITLE = "# AI Research Report with Historical Trends"
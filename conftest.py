@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Shared pytest fixtures for the summarizer tests
+"""
+
+import sys
+import os
+import time
+
+# Add the current directory to the Python path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, current_dir)
+
+import pytest
+
+from modules.ai_summarizer import AISummarizer
+
+@pytest.fixture
+def make_summarizer(monkeypatch):
+    """Factory for summarizers whose provider calls are replaced by fakes.
+    
+    providers maps a provider name to its outcome (a response or an exception to
+    raise) or to a list of outcomes used one per call; delays maps a provider name
+    to seconds slept before answering. Returns the summarizer and the list of
+    provider names in call order.
+    """
+    def make(providers, delays=None, hedge_seconds=0):
+        summarizer = AISummarizer()
+        monkeypatch.setattr(summarizer.config, "SUMMARY_HEDGE_SECONDS", hedge_seconds)
+        summarizer.client = object()
+        summarizer.ai_providers = {'gemini': True, 'anthropic': True}
+        calls = []
+        
+        def fake_call(name, outcomes):
+            def call(prompt, max_tokens=400, **kwargs):
+                calls.append(name)
+                time.sleep((delays or {}).get(name, 0))
+                outcome = outcomes.pop(0) if isinstance(outcomes, list) else outcomes
+                if isinstance(outcome, Exception):
+                    raise outcome
+                return outcome
+            return call
+        
+        for name, outcomes in providers.items():
+            setattr(summarizer, f"_call_{name}", fake_call(name, outcomes))
+        return summarizer, calls
+    return make
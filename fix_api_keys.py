@@ -4,144 +4,150 @@ Interactive API Key Fixer for AI Research Agent
 Helps you update non-working API keys step by step
 """
 
+import io
 import os
-import webbrowser
-from dotenv import load_dotenv
+import shutil
+import tempfile
+import threading
+from api_catalog import PLACEHOLDER_SUFFIXES, PRIORITY_APIS, env_line_key, parse_env_keys
+
+# Fixed text is kept as module constants and printed in one call per block
+HEADER = """🔧 API Key Fix Assistant
+==================================================
+Let's fix your API keys step by step!
+"""
+
+KNOWN_ISSUES = """📊 Issues found:
+❌ OpenAI: Quota exceeded (no credits)
+❌ Google Search: Invalid/forbidden
+❌ NewsAPI: Invalid key
+❌ All enhanced APIs: Using placeholders
+"""
+
+API_TEMPLATE = """==================================================
+
+{api.name} - {api.summary}
+Free Tier: {api.free_tier}
+Website: {api.website}"""
+
+NEXT_STEPS = """
+==================================================
+🎯 NEXT STEPS:
+==================================================
+1. 💾 All changes saved to .env file
+2. 🔄 Restart your Streamlit app:
+   python -m streamlit run app.py
+3. ✅ Test with: python test_api_keys.py
+4. 🚀 Enjoy faster, better responses!"""
+
+# Websites already opened this session
+_opened_websites = set()
+
+def open_website(url):
+    """Open url in the browser on a background thread, at most once per session"""
+    if url in _opened_websites:
+        return
+    _opened_websites.add(url)
+    import webbrowser  # only needed once the user asks to open a site
+    threading.Thread(target=webbrowser.open, args=(url,), daemon=True).start()
+
+def is_placeholder(value):
+    """True for unset values and the '..._here' template values"""
+    return not value or value.endswith(PLACEHOLDER_SUFFIXES)
 
 def main():
-    print("🔧 API Key Fix Assistant")
-    print("=" * 50)
-    print("Let's fix your API keys step by step!\n")
+    print(HEADER)
     
-    # Load current .env
-    load_dotenv()
     env_path = ".env"
     
-    if not os.path.exists(env_path):
+    # Parse .env once; every "already configured?" check reads from this map.
+    # Opening the file doubles as the existence check, so there's no separate stat.
+    try:
+        env_map = parse_env_keys(env_path, [api.env_var for api in PRIORITY_APIS], missing_ok=False)
+    except FileNotFoundError:
         print("❌ .env file not found!")
         return
     
-    print("📊 Issues found:")
-    print("❌ OpenAI: Quota exceeded (no credits)")
-    print("❌ Google Search: Invalid/forbidden") 
-    print("❌ NewsAPI: Invalid key")
-    print("❌ All enhanced APIs: Using placeholders\n")
+    print(KNOWN_ISSUES)
     
-    # Priority fixes
-    priority_apis = [
-        {
-            "name": "🔥 Perplexity AI",
-            "env_var": "PERPLEXITY_API_KEY",
-            "website": "https://www.perplexity.ai/",
-            "instructions": [
-                "1. Click 'Sign Up' (free account)",
-                "2. Go to Settings → API",
-                "3. Click 'Generate API Key'",
-                "4. Copy key starting with 'pplx-'"
-            ],
-            "benefit": "Real-time AI responses (replaces OpenAI)",
-            "free_tier": "5 requests/hour FREE"
-        },
-        {
-            "name": "🧠 Anthropic Claude",
-            "env_var": "ANTHROPIC_API_KEY", 
-            "website": "https://console.anthropic.com/",
-            "instructions": [
-                "1. Sign up for free account",
-                "2. Verify email address",
-                "3. Go to API Keys section",
-                "4. Create new key starting with 'sk-ant-'"
-            ],
-            "benefit": "Superior AI analysis (backup for OpenAI)",
-            "free_tier": "$5 FREE credits"
-        },
-        {
-            "name": "🌐 Tavily Search",
-            "env_var": "TAVILY_API_KEY",
-            "website": "https://tavily.com/",
-            "instructions": [
-                "1. Sign up for free account",
-                "2. Verify email",
-                "3. Go to Dashboard → API Keys",
-                "4. Copy key starting with 'tvly-'"
-            ],
-            "benefit": "Real-time web search (replaces Google)",
-            "free_tier": "1000 searches/month FREE"
-        }
-    ]
+    # New keys are reflected in env_map right away and written to .env in one
+    # pass when the walkthrough ends, even if it is interrupted part way
+    pending = {}
     
-    for api in priority_apis:
-        print("=" * 50)
-        print(f"\n{api['name']} - {api['benefit']}")
-        print(f"Free Tier: {api['free_tier']}")
-        print(f"Website: {api['website']}")
-        
-        # Check current value
-        current_value = os.getenv(api['env_var'])
-        if current_value and not current_value.endswith('-here'):
-            print(f"✅ Already configured!")
-            continue
-        
-        print("\n📋 Setup Steps:")
-        for instruction in api['instructions']:
-            print(f"   {instruction}")
-        
-        # Offer to open website
-        try:
-            choice = input(f"\n🌐 Open {api['website']} now? (y/n): ").lower().strip()
-            if choice == 'y':
-                webbrowser.open(api['website'])
-                print("✅ Website opened in browser!")
-                
-                # Ask for the API key
-                new_key = input(f"\n🔑 Paste your new {api['name']} API key: ").strip()
-                if new_key and len(new_key) > 10:
-                    # Update .env file
-                    update_env_file(api['env_var'], new_key)
-                    print(f"✅ {api['name']} key saved!")
-                else:
-                    print("⚠️ Invalid key - you can update manually later")
+    try:
+        for api in PRIORITY_APIS:
+            print(API_TEMPLATE.format(api=api))
+            
+            # Check current value
+            if not is_placeholder(env_map.get(api.env_var, '')):
+                print(f"✅ Already configured!")
+                continue
+            
+            print("\n📋 Setup Steps:\n" + "\n".join(f"   {instruction}" for instruction in api.quick_steps))
+            
+            # Offer to open website
+            try:
+                choice = input(f"\n🌐 Open {api.website} now? (y/n): ").lower().strip()
+                if choice == 'y':
+                    open_website(api.website)
+                    print("✅ Website opened in browser!")
                     
-        except KeyboardInterrupt:
-            print("\n⏸️ Skipping this API...")
-            continue
-        except:
-            print(f"💻 Manually visit: {api['website']}")
-    
-    print("\n" + "=" * 50)
-    print("🎯 NEXT STEPS:")
-    print("=" * 50)
-    print("1. 💾 All changes saved to .env file")
-    print("2. 🔄 Restart your Streamlit app:")
-    print("   python -m streamlit run app.py")
-    print("3. ✅ Test with: python test_api_keys.py")
-    print("4. 🚀 Enjoy faster, better responses!")
+                    # Ask for the API key
+                    new_key = input(f"\n🔑 Paste your new {api.name} API key: ").strip()
+                    if new_key and len(new_key) > 10:
+                        pending[api.env_var] = env_map[api.env_var] = new_key
+                        print(f"✅ {api.name} key recorded!")
+                    else:
+                        print("⚠️ Invalid key - you can update manually later")
+                        
+            except KeyboardInterrupt:
+                print("\n⏸️ Skipping this API...")
+                continue
+            except:
+                print(f"💻 Manually visit: {api.website}")
+    finally:
+        if pending:
+            update_env_file(pending)
+            print(f"\n💾 Saved {len(pending)} key(s) to .env")
     
+    print(NEXT_STEPS)
     print(f"\n📁 .env file location: {os.path.abspath(env_path)}")
 
-def update_env_file(var_name, new_value):
-    """Update a specific variable in the .env file"""
+def update_env_file(updates):
+    """Set several variables in the .env file with a single read and an atomic replace"""
     env_path = ".env"
+    remaining = dict(updates)
+    buf = io.StringIO()
     
-    # Read current content
-    with open(env_path, 'r') as f:
-        lines = f.readlines()
-    
-    # Update the specific line
-    updated = False
-    for i, line in enumerate(lines):
-        if line.startswith(f"{var_name}="):
-            lines[i] = f"{var_name}={new_value}\n"
-            updated = True
-            break
+    with open(env_path, 'r', buffering=1 << 16) as f:
+        # One key parse per line and a dict lookup, regardless of how many keys change;
+        # keys are matched exactly as parse_env_keys reads them, 'export ' lines included
+        for line in f:
+            var_name = env_line_key(line)
+            if var_name in remaining:
+                prefix = "export " if line.lstrip().startswith("export ") else ""
+                line = f"{prefix}{var_name}={remaining.pop(var_name)}\n"
+            buf.write(line)
     
-    # If not found, add it
-    if not updated:
-        lines.append(f"{var_name}={new_value}\n")
+    # Append variables that weren't in the file yet
+    if remaining:
+        if buf.tell() and not buf.getvalue().endswith("\n"):
+            buf.write("\n")
+        for var_name, new_value in remaining.items():
+            buf.write(f"{var_name}={new_value}\n")
     
-    # Write back
-    with open(env_path, 'w') as f:
-        f.writelines(lines)
+    # Write a sibling temp file and swap it in, so an interrupted write never
+    # leaves a truncated .env behind
+    env_dir = os.path.dirname(os.path.abspath(env_path))
+    fd, tmp_path = tempfile.mkstemp(dir=env_dir, prefix=".env.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w') as tmp:
+            tmp.write(buf.getvalue())
+        shutil.copymode(env_path, tmp_path)
+        os.replace(tmp_path, env_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
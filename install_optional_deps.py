@@ -6,18 +6,91 @@ Installs optional dependencies for enhanced features like image analysis and OCR
 import subprocess
 import sys
 import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from importlib.metadata import version, PackageNotFoundError
+from importlib.util import find_spec
 
-def install_package(package_name):
+try:
+    from packaging.requirements import Requirement
+    PACKAGING_AVAILABLE = True
+except ImportError:
+    PACKAGING_AVAILABLE = False
+
+# Every pip run skips the self-update check (a network round trip), never waits on
+# a prompt, and prefers wheels over source builds
+PIP_FAST_ARGS = ("--disable-pip-version-check", "--no-input", "--prefer-binary")
+
+# Distribution name -> module it provides, for the cheap "already importable?" probe
+IMPORT_NAMES = {
+    "pytesseract": "pytesseract",
+    "opencv-python": "cv2",
+    "Pillow": "PIL",
+    "scikit-learn": "sklearn",
+    "numpy": "numpy"
+}
+
+def is_importable(requirement):
+    """Check whether the module a requirement provides can be found, without importing it"""
+    name = requirement.split("==")[0]
+    return find_spec(IMPORT_NAMES.get(name, name)) is not None
+
+def is_satisfied(requirement):
+    """Check an installed distribution against a pinned requirement without running pip"""
+    if PACKAGING_AVAILABLE:
+        req = Requirement(requirement)
+        name, specifier = req.name, req.specifier
+    else:
+        name, _, pinned = requirement.partition("==")
+        specifier = None
+    
+    try:
+        installed = version(name)
+    except PackageNotFoundError:
+        return False
+    
+    if specifier is None:
+        return installed == pinned
+    return specifier.contains(installed, prereleases=True)
+
+def download_package(package_name, dest_dir):
+    """Fetch a package's wheels into dest_dir without installing anything"""
+    try:
+        subprocess.check_call(
+            [
+                sys.executable, "-m", "pip", "download", *PIP_FAST_ARGS,
+                "--quiet", "--dest", dest_dir, package_name
+            ]
+        )
+        return True
+    except subprocess.CalledProcessError:
+        return False
+
+def install_package(package_name, find_links=None):
     """Install a package using pip"""
+    extra_args = ["--find-links", find_links] if find_links else []
     try:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", package_name])
+        subprocess.check_call([sys.executable, "-m", "pip", "install", *PIP_FAST_ARGS, *extra_args, package_name])
         print(f"✅ Successfully installed {package_name}")
         return True
     except subprocess.CalledProcessError as e:
         print(f"❌ Failed to install {package_name}: {e}")
         return False
 
-def main():
+def install_packages(package_names):
+    """Install several packages with a single pip invocation"""
+    try:
+        subprocess.check_call([
+            sys.executable, "-m", "pip", "install", *PIP_FAST_ARGS,
+            *package_names
+        ])
+        print(f"✅ Successfully installed {', '.join(package_names)}")
+        return True
+    except subprocess.CalledProcessError as e:
+        print(f"❌ Batch install failed: {e}")
+        return False
+
+def main(strict=False):
     print("🚀 Installing optional dependencies for AI Research Agent...")
     print("=" * 60)
     
@@ -33,10 +106,35 @@ def main():
     success_count = 0
     total_packages = len(core_packages)
     
+    # Skip requirements that are already installed so pip only runs when needed.
+    # By default any importable version counts; --strict enforces the pinned versions.
+    already_installed = is_satisfied if strict else is_importable
+    missing = []
     for package in core_packages:
-        print(f"\n📦 Installing {package}...")
-        if install_package(package):
+        if already_installed(package):
+            print(f"✅ {package} already satisfied")
             success_count += 1
+        else:
+            missing.append(package)
+    
+    # One pip run resolves and downloads everything together; only if that fails
+    # do we retry package by package to find out which ones can be installed
+    if missing:
+        print(f"\n📦 Installing {len(missing)} packages...")
+        if install_packages(missing):
+            success_count = total_packages
+        else:
+            print("\n🔁 Retrying packages individually...")
+            # Downloads are network-bound and independent, so fetch them concurrently;
+            # installs stay sequential because parallel pip runs would race on site-packages
+            with tempfile.TemporaryDirectory() as wheel_dir:
+                with ThreadPoolExecutor(max_workers=min(len(missing), 4)) as executor:
+                    list(executor.map(lambda package: download_package(package, wheel_dir), missing))
+                
+                for package in missing:
+                    print(f"\n📦 Installing {package}...")
+                    if install_package(package, find_links=wheel_dir):
+                        success_count += 1
     
     print("\n" + "=" * 60)
     print(f"Installation complete: {success_count}/{total_packages} packages installed successfully")
@@ -58,4 +156,4 @@ def main():
     print("\n🚀 You can now run the app with: streamlit run app.py")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main(strict="--strict" in sys.argv[1:])
\ No newline at end of file
@@ -3,36 +3,352 @@ AI Summarization Module for AI Research Agent
 Handles AI-powered content summarization and analysis
 """
 
-from openai import OpenAI
+import hashlib
 import json
 import logging
 from typing import Dict, List, Optional
 from datetime import datetime
 import re
+import threading
+import time
+from functools import lru_cache
+from itertools import islice
+from pathlib import Path
 import requests
+from requests.adapters import HTTPAdapter
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 
 from config import Config
 
 # Optional cache manager import
 try:
-    from .cache_manager import cache_manager
+    from .cache_manager import cache_manager, get_semantic_summary_cache
     CACHE_AVAILABLE = True
 except ImportError:
     CACHE_AVAILABLE = False
     cache_manager = None
+    get_semantic_summary_cache = None
+
+# Fast JSON for provider request/response bodies (optional)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Near-duplicate paragraph detection for prompt content (optional)
+try:
+    from datasketch import MinHash, MinHashLSH
+    DATASKETCH_AVAILABLE = True
+except ImportError:
+    DATASKETCH_AVAILABLE = False
+
+# Token-accurate prompt truncation (optional); the encoding itself is loaded on
+# first use by _token_encoder, since tiktoken downloads it the first time
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
+def _json_body(data) -> bytes:
+    """Serialize a provider request payload"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data)
+    return json.dumps(data).encode('utf-8')
+
+def _json_loads(raw: bytes):
+    """Decode a JSON document from raw bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def _json_result(response):
+    """Decode a provider response straight from its raw bytes"""
+    return _json_loads(response.content)
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Summary providers in order of preference: (provider key, call method, display name)
+SUMMARY_PROVIDERS = (
+    ('openai', '_call_openai', 'OpenAI'),
+    ('gemini', '_call_gemini', 'Gemini'),
+    ('anthropic', '_call_anthropic', 'Anthropic'),
+    ('perplexity', '_call_perplexity', 'Perplexity'),
+    ('huggingface', '_call_huggingface', 'Hugging Face'),
+    ('cohere', '_call_cohere', 'Cohere'),
+    ('together', '_call_together', 'Together AI'),
+    ('ollama', '_call_ollama', 'Ollama (Local)')
+)
+
+# Fixed instructions for summarize_content; the query and content are appended after
+# them, so the prompt prefix is identical across requests and provider-side prompt
+# caches can reuse it
+SYSTEM_SUMMARY_PROMPT = """Provide a comprehensive summary of the content below about the given query.
+
+Requirements:
+- 2-3 paragraphs maximum
+- Focus on key information and insights
+- Use clear, professional language
+- Highlight important facts or findings
+"""
+
+def _make_result(summary: str, provider: str, timestamp: str) -> Dict:
+    """Successful summarize_content result"""
+    return {
+        "summary": summary,
+        "provider": provider,
+        "success": True,
+        "timestamp": timestamp
+    }
+
+def _summary_prompt(query: str, content: str) -> str:
+    """summarize_content prompt: static instructions first, so every request shares the same prefix"""
+    return SYSTEM_SUMMARY_PROMPT + f"""
+Query: {query}
+
+Content:
+{content[:4000]}
+
+Summary:
+"""
+
+# System prompt sent separately to providers that accept one
+ANALYST_SYSTEM_PROMPT = "You are a professional research analyst who creates clear, comprehensive summaries of content."
+OPENAI_SYSTEM_PROMPT = "You are an expert research analyst who creates comprehensive, accurate, and well-structured summaries of research content."
+
+# Most provider calls in flight at once when SUMMARY_HEDGE_SECONDS enables hedging
+SUMMARY_HEDGE_WIDTH = 2
+
+# Circuit breaker: after this many consecutive failures a provider is skipped for
+# BREAKER_BASE_SECONDS, doubling with each further failure up to BREAKER_MAX_SECONDS.
+# Once the wait is over a single trial call is let through; success closes the breaker
+BREAKER_FAILURE_THRESHOLD = 3
+BREAKER_BASE_SECONDS = 30
+BREAKER_MAX_SECONDS = 600
+
+# A bulleted or numbered line, after any indentation
+_BULLET_RE = re.compile(r'\s*(?:[•\-*]|\d+\.)')
+
+# The marker itself; '-', '*' and numbers need a following space so '**bold**' and '-5%' stay intact
+_BULLET_MARKER_RE = re.compile(r'\s*(?:•\s*|[-*]\s+|\d+\.\s+)')
+
+def _strip_bullet(line: str) -> str:
+    """Finding text without its leading bullet or number, so every key_findings path returns plain strings"""
+    marker = _BULLET_MARKER_RE.match(line)
+    return (line[marker.end():] if marker else line).strip()
+
+# Paragraph breaks in extracted article text
+_PARAGRAPH_SPLIT_RE = re.compile(r'\n\s*\n')
+
+# Characters of text each source may contribute to the combined prompt content
+SOURCE_CHAR_BUDGET = 2000
+
+def _is_repeated_paragraph(paragraph: str, seen: set, lsh, key: str) -> bool:
+    """True if the paragraph (or, with datasketch, a near copy of it) was already kept"""
+    normalized = ' '.join(paragraph.lower().split())
+    digest = hashlib.blake2b(normalized.encode('utf-8', 'ignore'), digest_size=8).digest()
+    if digest in seen:
+        return True
+    seen.add(digest)
+    
+    words = normalized.split()
+    if lsh is None or len(words) < 8:
+        return False
+    
+    # MinHash over 8-word shingles; LSH finds kept paragraphs with Jaccard >= 0.8
+    minhash = MinHash(num_perm=64)
+    for start in range(len(words) - 7):
+        minhash.update(' '.join(words[start:start + 8]).encode('utf-8'))
+    if lsh.query(minhash):
+        return True
+    lsh.insert(key, minhash)
+    return False
+
+# Token budget for research content in the summarize_research prompts
+# (about the 8000 characters previously sent for English text)
+PROMPT_CONTENT_TOKENS = 2000
+
+@lru_cache(maxsize=None)
+def _token_encoder():
+    """The cl100k_base encoder, or None when tiktoken is missing or can't load it (e.g. offline)"""
+    if not TIKTOKEN_AVAILABLE:
+        return None
+    try:
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        logger.warning(f"tiktoken encoding unavailable, estimating tokens from characters: {str(e)}")
+        return None
+
+def _truncate_tokens(text: str, max_tokens: int) -> str:
+    """Cut text to at most max_tokens tokens (roughly 4 characters each without tiktoken)"""
+    encoder = _token_encoder()
+    if encoder is None:
+        return text[:max_tokens * 4]
+    tokens = encoder.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text
+    return encoder.decode(tokens[:max_tokens])
+
+# Field descriptions for the single structured summarize_research call
+STRUCTURED_SECTION_SPECS = {
+    "executive_summary": '"executive_summary": string - a 3-4 paragraph executive summary of the most important findings, key statistics or data points and actionable insights, in a professional, accessible tone',
+    "key_findings": '"key_findings": array of 5-7 strings - the most important findings as concise sentences without bullet markers, with specific data, statistics or evidence when available',
+    "detailed_analysis": '"detailed_analysis": string - an analytical, accessible discussion of the current state of the topic, recent developments and breakthroughs, challenges and limitations, future implications and trends, and differing perspectives, with examples from the sources',
+    "trend_analysis": '"trend_analysis": object with string arrays "emerging_trends", "recurring_themes", "consensus_points", "debates", "research_gaps", "future_directions" and a string "analysis_text" describing the trends and patterns'
+}
+
+# Output token budget of the separate section prompts, reused for the combined call
+STRUCTURED_SUMMARY_MAX_TOKENS = 3100
+
+# Comprehensive-detail fields listed per source in the ChatGPT-style prompt, in order
+SOURCE_DETAIL_LABELS = (
+    ("purpose", "Purpose"),
+    ("scope", "Scope"),
+    ("input_output", "Input/Output"),
+    ("key_features", "Key Features"),
+    ("audience_use_case", "Audience/Use Case")
+)
+
+# Trend-analysis list items: a bullet character, or one of the first three numbered items
+_TREND_BULLET_CHARS = frozenset(('•', '-', '*'))
+_TREND_NUMBERED_PREFIXES = frozenset(('1.', '2.', '3.'))
+
+TREND_ANALYSIS_LISTS = ("emerging_trends", "recurring_themes", "consensus_points", "debates", "research_gaps", "future_directions")
+
+# Trend-analysis section headers, checked in priority order: each alternative is a
+# lookahead over the whole line, so the first section whose keywords appear anywhere
+# in it wins (a leftmost-match alternation would pick whichever keyword came first)
+_TREND_SECTION_RE = re.compile(
+    r'(?:(?=.*?(?:emerging|trend))(?P<emerging_trends>)'
+    r'|(?=.*?(?:recurring|theme))(?P<recurring_themes>)'
+    r'|(?=.*?(?:consensus|agreement))(?P<consensus_points>)'
+    r'|(?=.*?(?:debate|disagreement|controversy))(?P<debates>)'
+    r'|(?=.*?(?:gap|limitation|missing))(?P<research_gaps>)'
+    r'|(?=.*?(?:future|direction|recommendation))(?P<future_directions>))',
+    re.IGNORECASE
+)
+
+# Source domain categories in priority order (same lookahead scheme as above)
+_DOMAIN_CATEGORY_RE = re.compile(
+    r'(?:(?=.*?(?:\.edu|university|college))(?P<academic>)'
+    r'|(?=.*?(?:\.com|news|media))(?P<news>)'
+    r'|(?=.*?\.gov)(?P<government>)'
+    r'|(?=.*?\.org)(?P<organization>))'
+)
+
+# Domains treated as high-authority sources
+_HIGH_QUALITY_DOMAIN_RE = re.compile(r'\.edu|\.gov|\.org|nature\.com|science\.org|arxiv\.org')
+
+# One sentence: up to terminal punctuation followed by whitespace (so decimals and
+# URLs don't split), or up to the end of the text
+_SENTENCE_RE = re.compile(r'\S.*?(?:[.!?](?=\s|$)|$)', re.DOTALL)
+
+def _iter_sentences(text: str, longer_than: int = 20):
+    """Yield stripped sentences longer than longer_than characters, reading text lazily"""
+    for match in _SENTENCE_RE.finditer(text):
+        sentence = match.group().strip()
+        if len(sentence) > longer_than:
+            yield sentence
+
+def _content_digest(content: str) -> str:
+    """Fixed-size hash of the full content"""
+    return hashlib.blake2b(content.encode('utf-8', 'ignore'), digest_size=16).hexdigest()
+
+# Follow-up queries whose summaries are warmed in the background (opt-in)
+FOLLOWUP_QUERY_TEMPLATES = ("trends in {query}", "challenges in {query}")
+
+# Low-priority pool shared by all summarizers, so prefetching never crowds out live requests
+_prefetch_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="summary-prefetch")
+_prefetching = set()
+_prefetch_lock = threading.Lock()
+
+# With BATCH_SOURCE_SUMMARIES on, research over at least this many sources is
+# summarized source by source first. Progress goes to a per-query checkpoint so a
+# failed run resumes instead of starting over; it is removed once the run completes.
+BATCH_SUMMARY_MIN_SOURCES = 20
+SOURCE_SUMMARY_CHECKPOINT_DIR = "source_summaries"
+
+def _source_checkpoint_path(query: str) -> Path:
+    """Checkpoint file of the per-source summaries for one query"""
+    query_digest = hashlib.blake2b(query.encode('utf-8', 'ignore'), digest_size=8).hexdigest()
+    cache_dir = Path(cache_manager.cache_dir if CACHE_AVAILABLE else "cache")
+    return cache_dir / SOURCE_SUMMARY_CHECKPOINT_DIR / f"{query_digest}.jsonl"
+
+def _cache_key(query: str, content: str) -> str:
+    """Fixed-size summary cache key from a hash of the whole content and the query"""
+    query_digest = hashlib.blake2b(query.encode('utf-8', 'ignore'), digest_size=8).hexdigest()
+    return f"{_content_digest(content)}:{query_digest}"
+
+GEMINI_MODEL = 'gemini-1.5-flash'
+
+# Completed OpenAI/Gemini/Anthropic responses kept per summarizer, least recently used evicted first
+RESPONSE_CACHE_SIZE = 256
+
+def _response_key(model: str, prompt: str, *params) -> str:
+    """Fixed-size response cache key from the model, call parameters and full prompt"""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (model, *params):
+        digest.update(str(part).encode('utf-8', 'ignore'))
+        digest.update(b'\x00')
+    digest.update(prompt.encode('utf-8', 'ignore'))
+    return digest.hexdigest()
+
 class AISummarizer:
     """AI-powered content summarization and analysis"""
     
+    # Static parts of each provider's request payload; per-call fields are merged in
+    _ANALYST_SYSTEM_MESSAGE = {'role': 'system', 'content': ANALYST_SYSTEM_PROMPT}
+    _TOGETHER_SYSTEM_MESSAGE = {
+        'role': 'system',
+        'content': 'You are a professional research analyst who creates clear, comprehensive summaries.'
+    }
+    _PERPLEXITY_DATA_TMPL = {
+        'model': 'llama-3.1-sonar-small-128k-chat',  # Fixed valid model name
+        'temperature': 0.2,
+        'stream': False
+    }
+    _ANTHROPIC_DATA_TMPL = {
+        'model': 'claude-3-haiku-20240307',
+        'temperature': 0.2,
+        'system': ANALYST_SYSTEM_PROMPT
+    }
+    _HUGGINGFACE_PARAMS_TMPL = {
+        'min_length': 100,
+        'do_sample': False
+    }
+    _COHERE_DATA_TMPL = {
+        'length': 'medium',
+        'format': 'paragraph',
+        'model': 'summarize-xlarge',
+        'additional_command': 'Focus on key insights and important findings.',
+        'temperature': 0.2
+    }
+    _TOGETHER_DATA_TMPL = {
+        'model': 'meta-llama/Llama-2-7b-chat-hf',
+        'temperature': 0.2,
+        'top_p': 0.9,
+        'stop': ['\n\n\n']
+    }
+    _OLLAMA_DATA_TMPL = {
+        'model': 'llama2',  # Default model, could be configurable
+        'stream': True
+    }
+    _OLLAMA_OPTIONS_TMPL = {
+        'temperature': 0.2,
+        'top_p': 0.9
+    }
+    
     def __init__(self):
         self.config = Config()
         # OpenAI client with graceful fallback
         if self.config.OPENAI_API_KEY:
             try:
+                # Imported only when a key is configured; the SDK is slow to import
+                from openai import OpenAI
                 self.client = OpenAI(api_key=self.config.OPENAI_API_KEY)
             except Exception as e:
                 logger.warning(f"OpenAI client initialization failed: {str(e)}")
@@ -44,6 +360,51 @@ class AISummarizer:
         # Check available AI providers
         self.ai_providers = self._get_available_providers()
         logger.info(f"Available AI providers: {list(self.ai_providers.keys())}")
+        
+        # Provider request headers don't change between calls, so build them once
+        json_headers = {'Content-Type': 'application/json'}
+        self._perplexity_headers = {**json_headers, 'Authorization': f'Bearer {self.config.PERPLEXITY_API_KEY}'}
+        self._anthropic_headers = {
+            **json_headers,
+            'x-api-key': self.config.ANTHROPIC_API_KEY,
+            'anthropic-version': '2023-06-01'
+        }
+        self._huggingface_headers = {**json_headers, 'Authorization': f'Bearer {self.config.HUGGINGFACE_API_KEY}'}
+        self._cohere_headers = {**json_headers, 'Authorization': f'Bearer {self.config.COHERE_API_KEY}'}
+        self._together_headers = {**json_headers, 'Authorization': f'Bearer {self.config.TOGETHER_API_KEY}'}
+        self._ollama_headers = json_headers
+        
+        # Pooled provider sessions, one per thread (see the session property)
+        self._session_local = threading.local()
+        
+        # Per-provider circuit breakers so known-down providers are skipped
+        self._breaker = {key: {"fails": 0, "open_until": 0.0} for key, _, _ in SUMMARY_PROVIDERS}
+        self._breaker_lock = threading.Lock()
+        
+        # Near-duplicate query cache (opt-in; needs sentence-transformers and faiss)
+        self.semantic_cache = None
+        if CACHE_AVAILABLE and self.config.SEMANTIC_SUMMARY_CACHE:
+            self.semantic_cache = get_semantic_summary_cache()
+        
+        # Exact-repeat cache of provider responses, so overlapping calls skip the API
+        self._response_cache = OrderedDict()
+        self._response_cache_lock = threading.Lock()
+    
+    def _get_cached_response(self, key: str) -> Optional[str]:
+        """Previously returned response for this call, if still cached"""
+        with self._response_cache_lock:
+            response = self._response_cache.get(key)
+            if response is not None:
+                self._response_cache.move_to_end(key)
+            return response
+    
+    def _store_response(self, key: str, response: str):
+        """Remember a provider response, evicting the least recently used past the size limit"""
+        with self._response_cache_lock:
+            self._response_cache[key] = response
+            self._response_cache.move_to_end(key)
+            if len(self._response_cache) > RESPONSE_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
     
     def _get_available_providers(self) -> Dict[str, bool]:
         """Check which AI providers are available and working"""
@@ -86,37 +447,21 @@ class AISummarizer:
     def _call_perplexity(self, prompt: str, max_tokens: int = 400) -> str:
         """Call Perplexity API for summarization"""
         try:
-            headers = {
-                'Authorization': f'Bearer {self.config.PERPLEXITY_API_KEY}',
-                'Content-Type': 'application/json'
-            }
-            
             data = {
-                'model': 'llama-3.1-sonar-small-128k-chat',  # Fixed valid model name
-                'messages': [
-                    {
-                        'role': 'system',
-                        'content': 'You are a professional research analyst who creates clear, comprehensive summaries of content.'
-                    },
-                    {
-                        'role': 'user',
-                        'content': prompt
-                    }
-                ],
-                'max_tokens': max_tokens,
-                'temperature': 0.2,
-                'stream': False
+                **self._PERPLEXITY_DATA_TMPL,
+                'messages': [self._ANALYST_SYSTEM_MESSAGE, {'role': 'user', 'content': prompt}],
+                'max_tokens': max_tokens
             }
             
-            response = requests.post(
+            response = self.session.post(
                 'https://api.perplexity.ai/chat/completions',
-                headers=headers,
-                json=data,
+                headers=self._perplexity_headers,
+                data=_json_body(data),
                 timeout=30
             )
             
             if response.status_code == 200:
-                result = response.json()
+                result = _json_result(response)
                 return result['choices'][0]['message']['content'].strip()
             else:
                 raise Exception(f"Perplexity API error: {response.status_code} - {response.text}")
@@ -127,35 +472,30 @@ class AISummarizer:
     
     def _call_anthropic(self, prompt: str, max_tokens: int = 400) -> str:
         """Call Anthropic Claude API for summarization"""
+        cache_key = _response_key(self._ANTHROPIC_DATA_TMPL['model'], prompt, max_tokens)
+        cached = self._get_cached_response(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
-            headers = {
-                'x-api-key': self.config.ANTHROPIC_API_KEY,
-                'Content-Type': 'application/json',
-                'anthropic-version': '2023-06-01'
-            }
-            
             data = {
-                'model': 'claude-3-haiku-20240307',
+                **self._ANTHROPIC_DATA_TMPL,
                 'max_tokens': max_tokens,
-                'temperature': 0.2,
-                'messages': [
-                    {
-                        'role': 'user',
-                        'content': prompt
-                    }
-                ]
+                'messages': [{'role': 'user', 'content': prompt}]
             }
             
-            response = requests.post(
+            response = self.session.post(
                 'https://api.anthropic.com/v1/messages',
-                headers=headers,
-                json=data,
+                headers=self._anthropic_headers,
+                data=_json_body(data),
                 timeout=30
             )
             
             if response.status_code == 200:
-                result = response.json()
-                return result['content'][0]['text'].strip()
+                result = _json_result(response)
+                text = result['content'][0]['text'].strip()
+                self._store_response(cache_key, text)
+                return text
             else:
                 raise Exception(f"Anthropic API error: {response.status_code} - {response.text}")
                 
@@ -166,32 +506,23 @@ class AISummarizer:
     def _call_huggingface(self, prompt: str, max_tokens: int = 400) -> str:
         """Call Hugging Face Inference API for summarization"""
         try:
-            headers = {
-                'Authorization': f'Bearer {self.config.HUGGINGFACE_API_KEY}',
-                'Content-Type': 'application/json'
-            }
-            
             # Use Facebook's BART model for summarization
             api_url = "https://api-inference.huggingface.co/models/facebook/bart-large-cnn"
             
             data = {
                 'inputs': prompt,
-                'parameters': {
-                    'max_length': max_tokens,
-                    'min_length': 100,
-                    'do_sample': False
-                }
+                'parameters': {**self._HUGGINGFACE_PARAMS_TMPL, 'max_length': max_tokens}
             }
             
-            response = requests.post(
+            response = self.session.post(
                 api_url,
-                headers=headers,
-                json=data,
+                headers=self._huggingface_headers,
+                data=_json_body(data),
                 timeout=30
             )
             
             if response.status_code == 200:
-                result = response.json()
+                result = _json_result(response)
                 if isinstance(result, list) and len(result) > 0:
                     return result[0]['summary_text'].strip()
                 else:
@@ -206,29 +537,17 @@ class AISummarizer:
     def _call_cohere(self, prompt: str, max_tokens: int = 400) -> str:
         """Call Cohere API for summarization"""
         try:
-            headers = {
-                'Authorization': f'Bearer {self.config.COHERE_API_KEY}',
-                'Content-Type': 'application/json'
-            }
-            
-            data = {
-                'text': prompt,
-                'length': 'medium',
-                'format': 'paragraph',
-                'model': 'summarize-xlarge',
-                'additional_command': 'Focus on key insights and important findings.',
-                'temperature': 0.2
-            }
+            data = {**self._COHERE_DATA_TMPL, 'text': prompt}
             
-            response = requests.post(
+            response = self.session.post(
                 'https://api.cohere.ai/v1/summarize',
-                headers=headers,
-                json=data,
+                headers=self._cohere_headers,
+                data=_json_body(data),
                 timeout=30
             )
             
             if response.status_code == 200:
-                result = response.json()
+                result = _json_result(response)
                 return result['summary'].strip()
             else:
                 raise Exception(f"Cohere API error: {response.status_code} - {response.text}")
@@ -240,38 +559,21 @@ class AISummarizer:
     def _call_together(self, prompt: str, max_tokens: int = 400) -> str:
         """Call Together AI for summarization"""
         try:
-            headers = {
-                'Authorization': f'Bearer {self.config.TOGETHER_API_KEY}',
-                'Content-Type': 'application/json'
-            }
-            
             data = {
-                'model': 'meta-llama/Llama-2-7b-chat-hf',
-                'messages': [
-                    {
-                        'role': 'system',
-                        'content': 'You are a professional research analyst who creates clear, comprehensive summaries.'
-                    },
-                    {
-                        'role': 'user',
-                        'content': prompt
-                    }
-                ],
-                'max_tokens': max_tokens,
-                'temperature': 0.2,
-                'top_p': 0.9,
-                'stop': ['\n\n\n']
+                **self._TOGETHER_DATA_TMPL,
+                'messages': [self._TOGETHER_SYSTEM_MESSAGE, {'role': 'user', 'content': prompt}],
+                'max_tokens': max_tokens
             }
             
-            response = requests.post(
+            response = self.session.post(
                 'https://api.together.xyz/v1/chat/completions',
-                headers=headers,
-                json=data,
+                headers=self._together_headers,
+                data=_json_body(data),
                 timeout=30
             )
             
             if response.status_code == 200:
-                result = response.json()
+                result = _json_result(response)
                 return result['choices'][0]['message']['content'].strip()
             else:
                 raise Exception(f"Together AI API error: {response.status_code} - {response.text}")
@@ -283,33 +585,33 @@ class AISummarizer:
     def _call_ollama(self, prompt: str, max_tokens: int = 400) -> str:
         """Call local Ollama for summarization"""
         try:
-            headers = {
-                'Content-Type': 'application/json'
-            }
-            
             data = {
-                'model': 'llama2',  # Default model, could be configurable
+                **self._OLLAMA_DATA_TMPL,
                 'prompt': prompt,
-                'stream': False,
-                'options': {
-                    'num_predict': max_tokens,
-                    'temperature': 0.2,
-                    'top_p': 0.9
-                }
+                'options': {**self._OLLAMA_OPTIONS_TMPL, 'num_predict': max_tokens}
             }
             
-            response = requests.post(
+            # Stream the newline-delimited chunks: the timeout then applies between
+            # tokens rather than to the whole generation, and we stop at 'done'
+            with self.session.post(
                 f'{self.config.OLLAMA_BASE_URL}/api/generate',
-                headers=headers,
-                json=data,
-                timeout=60  # Longer timeout for local processing
-            )
-            
-            if response.status_code == 200:
-                result = response.json()
-                return result['response'].strip()
-            else:
-                raise Exception(f"Ollama API error: {response.status_code} - {response.text}")
+                headers=self._ollama_headers,
+                data=_json_body(data),
+                timeout=60,  # Longer timeout for local processing
+                stream=True
+            ) as response:
+                if response.status_code == 200:
+                    parts = []
+                    for line in response.iter_lines():
+                        if not line:
+                            continue
+                        chunk = _json_loads(line)
+                        parts.append(chunk.get('response', ''))
+                        if chunk.get('done'):
+                            break
+                    return ''.join(parts).strip()
+                else:
+                    raise Exception(f"Ollama API error: {response.status_code} - {response.text}")
                 
         except Exception as e:
             logger.error(f"Ollama API call failed: {str(e)}")
@@ -317,11 +619,16 @@ class AISummarizer:
     
     def _call_gemini(self, prompt: str, max_tokens: int = 400) -> str:
         """Call Google Gemini API for summarization"""
+        cache_key = _response_key(GEMINI_MODEL, prompt, max_tokens)
+        cached = self._get_cached_response(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
             import google.generativeai as genai
             
             genai.configure(api_key=self.config.GEMINI_API_KEY)
-            model = genai.GenerativeModel('gemini-1.5-flash')  # Updated model name
+            model = genai.GenerativeModel(GEMINI_MODEL)
             
             # Configure generation parameters
             generation_config = genai.types.GenerationConfig(
@@ -337,7 +644,9 @@ class AISummarizer:
             )
             
             if response.text:
-                return response.text.strip()
+                text = response.text.strip()
+                self._store_response(cache_key, text)
+                return text
             else:
                 raise Exception("Gemini API returned empty response")
                 
@@ -348,13 +657,160 @@ class AISummarizer:
             logger.error(f"Gemini API call failed: {str(e)}")
             raise e
     
-    def summarize_content(self, content: str, query: str) -> Dict:
+    @property
+    def session(self) -> requests.Session:
+        """This thread's pooled session for provider calls.
+        
+        requests.Session isn't thread-safe, and provider calls also run on hedge,
+        prefetch and checkpoint worker threads, so each thread keeps its own;
+        keep-alive connections (and their TLS handshakes) are reused within it.
+        """
+        session = getattr(self._session_local, 'session', None)
+        if session is None:
+            session = self._session_local.session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+        return session
+    
+    def _provider_available(self, key: str) -> bool:
+        """False while the provider's circuit breaker is open.
+        
+        After the backoff a True answer admits one trial call (half-open); other
+        callers are held back until that call's outcome is recorded.
+        """
+        with self._breaker_lock:
+            breaker = self._breaker[key]
+            now = time.monotonic()
+            if now < breaker["open_until"]:
+                return False
+            if breaker["fails"] >= BREAKER_FAILURE_THRESHOLD:
+                breaker["open_until"] = now + BREAKER_BASE_SECONDS
+            return True
+    
+    def _call_provider(self, key: str, prompt: str, max_tokens: int = 400, **kwargs) -> str:
+        """Call one provider through its circuit breaker; raises without calling it while the breaker is open"""
+        if not self._provider_available(key):
+            raise Exception(f"{key} skipped while its circuit breaker is open")
+        return self._run_provider(key, prompt, max_tokens, **kwargs)
+    
+    def _run_provider(self, key: str, prompt: str, max_tokens: int = 400, **kwargs) -> str:
+        """Call a provider the breaker has admitted and record the outcome"""
+        try:
+            response = getattr(self, f"_call_{key}")(prompt, max_tokens=max_tokens, **kwargs)
+        except Exception:
+            self._record_provider_outcome(key, succeeded=False)
+            raise
+        self._record_provider_outcome(key, succeeded=True)
+        return response
+    
+    def _record_provider_outcome(self, key: str, succeeded: bool):
+        """Update a provider's circuit breaker once its call has finished"""
+        with self._breaker_lock:
+            breaker = self._breaker[key]
+            if succeeded:
+                breaker["fails"] = 0
+                breaker["open_until"] = 0.0
+                return
+            
+            breaker["fails"] += 1
+            excess = breaker["fails"] - BREAKER_FAILURE_THRESHOLD
+            if excess >= 0:
+                backoff = min(BREAKER_BASE_SECONDS * 2 ** min(excess, 8), BREAKER_MAX_SECONDS)
+                breaker["open_until"] = time.monotonic() + backoff
+                logger.info(f"Skipping {key} for {backoff}s after {breaker['fails']} consecutive failures")
+    
+    def _call_summary_providers(self, prompt: str, max_tokens: int = 400) -> Optional[tuple]:
+        """Try the providers in order of preference; returns (provider name, summary) of the first success.
+        
+        Each provider normally starts only after the previous one failed. With
+        SUMMARY_HEDGE_SECONDS set, a provider that hasn't answered within that delay
+        gets the next one started as a backup, and whichever succeeds first wins.
+        """
+        candidates = iter([
+            (key, method, name) for key, method, name in SUMMARY_PROVIDERS
+            if (self.client is not None if key == 'openai' else key in self.ai_providers)
+        ])
+        hedge_delay = self.config.SUMMARY_HEDGE_SECONDS or None
+        executor = ThreadPoolExecutor(max_workers=SUMMARY_HEDGE_WIDTH)
+        futures = {}
+        
+        def start_next():
+            # Breakers are checked when a provider's turn comes, not up front
+            for key, method, name in candidates:
+                if self._provider_available(key):
+                    future = executor.submit(self._run_provider, key, prompt, max_tokens)
+                    futures[future] = (len(futures), name)
+                    return future
+            return None
+        
+        first = start_next()
+        pending = {first} if first else set()
+        exhausted = first is None
+        
+        try:
+            while pending:
+                can_hedge = hedge_delay and not exhausted and len(pending) < SUMMARY_HEDGE_WIDTH
+                done, pending = wait(pending, timeout=hedge_delay if can_hedge else None, return_when=FIRST_COMPLETED)
+                
+                # Nothing answered in time, so start the next provider as a backup
+                if not done:
+                    backup = start_next()
+                    if backup:
+                        pending.add(backup)
+                    else:
+                        exhausted = True
+                    continue
+                
+                # Several can finish together; keep the usual preference among them
+                for future in sorted(done, key=lambda f: futures[f][0]):
+                    name = futures[future][1]
+                    try:
+                        response = future.result()
+                    except Exception as e:
+                        logger.warning(f"{name} summarization failed: {str(e)}")
+                        # Replace the failed call with the next provider
+                        replacement = None if exhausted else start_next()
+                        if replacement:
+                            pending.add(replacement)
+                        else:
+                            exhausted = True
+                        continue
+                    return name, response
+        finally:
+            # A slower hedged call may still be in flight; it finishes in the background
+            # (blocking HTTP calls can't be interrupted) and only updates its breaker
+            executor.shutdown(wait=False, cancel_futures=True)
+        
+        return None
+    
+    def _prefetch_followups(self, query: str, content: str):
+        """Warm the summary caches for likely follow-up queries in the background"""
+        for template in FOLLOWUP_QUERY_TEMPLATES:
+            followup = template.format(query=query)
+            key = _cache_key(followup, content)
+            with _prefetch_lock:
+                if key in _prefetching:
+                    continue
+                _prefetching.add(key)
+            
+            def warm(followup=followup, key=key):
+                try:
+                    self.summarize_content(content, followup, prefetch=False)
+                finally:
+                    with _prefetch_lock:
+                        _prefetching.discard(key)
+            
+            _prefetch_executor.submit(warm)
+    
+    def summarize_content(self, content: str, query: str, prefetch: bool = True) -> Dict:
         """
         Simple content summarization method for compatibility
         
         Args:
             content: Text content to summarize
             query: Research query for context
+            prefetch: Warm follow-up queries when PREFETCH_FOLLOWUP_SUMMARIES is on
             
         Returns:
             Dictionary with summary and metadata
@@ -369,157 +825,45 @@ class AISummarizer:
             
             # Check cache first
             if CACHE_AVAILABLE:
-                cache_key = f"{query}_{content[:100]}"
+                cache_key = _cache_key(query, content)
                 cached_result = cache_manager.get_summary_cache(cache_key, query, "simple")
                 if cached_result:
                     return cached_result
             
-            # Create a simple prompt for direct content summarization
-            prompt = f"""
-            Based on the following content about "{query}", provide a comprehensive summary.
-            
-            Requirements:
-            - 2-3 paragraphs maximum
-            - Focus on key information and insights
-            - Use clear, professional language
-            - Highlight important facts or findings
-            
-            Content:
-            {content[:4000]}
+            # Then look for a reworded query over the same content
+            if self.semantic_cache:
+                content_hash = _content_digest(content)
+                cached_result = self.semantic_cache.get(query, content_hash)
+                if cached_result:
+                    return cached_result
             
-            Summary:
-            """
+            # Create a simple prompt for direct content summarization
+            prompt = _summary_prompt(query, content)
             
             try:
-                # Try available AI providers in order of preference
-                result = None
-                
-                # Try OpenAI first (restored for reliable summaries)
-                if not result and self.client:
-                    try:
-                        response = self._call_openai(prompt, max_tokens=400)
-                        result = {
-                            "summary": response,
-                            "provider": "OpenAI",
-                            "success": True,
-                            "timestamp": datetime.now().isoformat()
-                        }
-                    except Exception as e:
-                        logger.warning(f"OpenAI summarization failed: {str(e)}")
-                        result = None
-                
-                # Try Gemini if OpenAI failed (free and reliable)
-                if not result and 'gemini' in self.ai_providers:
-                    try:
-                        response = self._call_gemini(prompt, max_tokens=400)
-                        result = {
-                            "summary": response,
-                            "provider": "Gemini",
-                            "success": True,
-                            "timestamp": datetime.now().isoformat()
-                        }
-                    except Exception as e:
-                        logger.warning(f"Gemini summarization failed: {str(e)}")
-                        result = None
-                
-                # Try Anthropic if previous failed (high quality)
-                if not result and 'anthropic' in self.ai_providers:
-                    try:
-                        response = self._call_anthropic(prompt, max_tokens=400)
-                        result = {
-                            "summary": response,
-                            "provider": "Anthropic",
-                            "success": True,
-                            "timestamp": datetime.now().isoformat()
-                        }
-                    except Exception as e:
-                        logger.warning(f"Anthropic summarization failed: {str(e)}")
-                        result = None
-                
-                # Try Perplexity if others failed (real-time data)
-                if not result and 'perplexity' in self.ai_providers:
-                    try:
-                        response = self._call_perplexity(prompt, max_tokens=400)
-                        result = {
-                            "summary": response,
-                            "provider": "Perplexity",
-                            "success": True,
-                            "timestamp": datetime.now().isoformat()
-                        }
-                    except Exception as e:
-                        logger.warning(f"Perplexity summarization failed: {str(e)}")
-                        result = None
-                
-                # Try Hugging Face if previous failed
-                if not result and 'huggingface' in self.ai_providers:
-                    try:
-                        response = self._call_huggingface(prompt, max_tokens=400)
-                        result = {
-                            "summary": response,
-                            "provider": "Hugging Face",
-                            "success": True,
-                            "timestamp": datetime.now().isoformat()
-                        }
-                    except Exception as e:
-                        logger.warning(f"Hugging Face summarization failed: {str(e)}")
-                        result = None
+                # Providers are tried in order of preference; the first successful summary wins
+                winner = self._call_summary_providers(prompt, max_tokens=400)
+                timestamp = datetime.now().isoformat()
                 
-                # Try Cohere if previous failed
-                if not result and 'cohere' in self.ai_providers:
-                    try:
-                        response = self._call_cohere(prompt, max_tokens=400)
-                        result = {
-                            "summary": response,
-                            "provider": "Cohere",
-                            "success": True,
-                            "timestamp": datetime.now().isoformat()
-                        }
-                    except Exception as e:
-                        logger.warning(f"Cohere summarization failed: {str(e)}")
-                        result = None
-                
-                # Try Together AI if previous failed
-                if not result and 'together' in self.ai_providers:
-                    try:
-                        response = self._call_together(prompt, max_tokens=400)
-                        result = {
-                            "summary": response,
-                            "provider": "Together AI",
-                            "success": True,
-                            "timestamp": datetime.now().isoformat()
-                        }
-                    except Exception as e:
-                        logger.warning(f"Together AI summarization failed: {str(e)}")
-                        result = None
-                
-                # Try local Ollama if previous failed
-                if not result and 'ollama' in self.ai_providers:
-                    try:
-                        response = self._call_ollama(prompt, max_tokens=400)
-                        result = {
-                            "summary": response,
-                            "provider": "Ollama (Local)",
-                            "success": True,
-                            "timestamp": datetime.now().isoformat()
-                        }
-                    except Exception as e:
-                        logger.warning(f"Ollama summarization failed: {str(e)}")
-                        result = None
-                
-                # Fallback to basic summary if all AI providers failed
-                if not result:
+                if winner:
+                    provider, summary = winner
+                    result = _make_result(summary, provider, timestamp)
+                else:
+                    # Fallback to basic summary if all AI providers failed
                     logger.info("All AI providers failed, using enhanced fallback")
-                    result = {
-                        "summary": self._generate_enhanced_fallback_summary(content, query),
-                        "provider": "Enhanced Fallback",
-                        "success": True,
-                        "timestamp": datetime.now().isoformat()
-                    }
+                    result = _make_result(
+                        self._generate_enhanced_fallback_summary(content, query), "Enhanced Fallback", timestamp
+                    )
                 
                 # Cache the result
                 if CACHE_AVAILABLE:
-                    cache_key = f"{query}_{content[:100]}"
                     cache_manager.set_summary_cache(cache_key, query, "simple", result)
+                if self.semantic_cache:
+                    self.semantic_cache.add(query, content_hash, result)
+                
+                # Use the idle time before the next question to answer likely follow-ups
+                if prefetch and self.config.PREFETCH_FOLLOWUP_SUMMARIES and (CACHE_AVAILABLE or self.semantic_cache):
+                    self._prefetch_followups(query, content)
                 
                 return result
                 
@@ -568,29 +912,46 @@ class AISummarizer:
         
         try:
             # Prepare content for AI processing
-            processed_content = self._prepare_content_for_ai(content_list)
-            
-            # Generate different types of summaries
-            summaries = {}
+            processed_content = self._prepare_content_for_ai(content_list, query)
             
+            # Pick the AI-written sections for this summary type
+            sections = []
             if summary_type in ["comprehensive", "brief"]:
-                summaries["executive_summary"] = self._generate_executive_summary(
-                    processed_content, query
-                )
+                sections.append(("executive_summary", self._generate_executive_summary))
             
             if summary_type in ["comprehensive", "detailed"]:
-                summaries["key_findings"] = self._generate_key_findings(
-                    processed_content, query
-                )
-                summaries["detailed_analysis"] = self._generate_detailed_analysis(
-                    processed_content, query
-                )
+                sections.append(("key_findings", self._generate_key_findings))
+                sections.append(("detailed_analysis", self._generate_detailed_analysis))
             
             # Generate trend analysis (unique feature)
             if self.config.ENABLE_TREND_ANALYSIS:
-                summaries["trend_analysis"] = self._generate_trend_analysis(
-                    processed_content, query
+                sections.append(("trend_analysis", self._generate_trend_analysis))
+            
+            # One JSON-mode call covers all sections, so the shared content is
+            # sent (and prefilled) once rather than once per section
+            generated = {}
+            if self.client and len(sections) > 1:
+                generated = self._generate_structured_summary(
+                    processed_content, query, [name for name, _ in sections]
                 )
+            remaining = [(name, generate) for name, generate in sections if name not in generated]
+            
+            # Sections it didn't cover are independent prompts over the same content,
+            # so their round trips can overlap instead of running back to back
+            if self.config.PARALLEL_AI_PROCESSING and len(remaining) > 1:
+                workers = min(len(remaining), self.config.MAX_CONCURRENT_REQUESTS)
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    futures = [
+                        (name, executor.submit(generate, processed_content, query))
+                        for name, generate in remaining
+                    ]
+                    for name, future in futures:
+                        generated[name] = future.result()
+            else:
+                for name, generate in remaining:
+                    generated[name] = generate(processed_content, query)
+            
+            summaries = {name: generated[name] for name, _ in sections}
             
             # Generate source analysis
             summaries["source_analysis"] = self._analyze_sources(content_list)
@@ -618,25 +979,150 @@ class AISummarizer:
             logger.error(f"Summarization failed: {str(e)}")
             return {"error": f"Summarization failed: {str(e)}"}
     
-    def _prepare_content_for_ai(self, content_list: List[Dict]) -> str:
+    def _summarize_sources_checkpointed(self, content_list: List[Dict], query: str) -> List[str]:
+        """Summarize each source, resuming from and appending to the query's JSONL checkpoint"""
+        checkpoint_path = _source_checkpoint_path(query)
+        keys = [_cache_key(query, content.get('text', '')) for content in content_list]
+        
+        # Summaries finished by earlier (possibly interrupted) runs
+        completed = {}
+        try:
+            with open(checkpoint_path, 'rb') as f:
+                for line in f:
+                    try:
+                        record = _json_loads(line)
+                        completed[record['hash']] = record['summary']
+                    except (ValueError, KeyError):
+                        continue  # torn last line from an interrupted write
+        except FileNotFoundError:
+            pass
+        
+        # Duplicate sources are summarized once
+        todo, queued = [], set()
+        for idx, key in enumerate(keys):
+            if key not in completed and key not in queued:
+                queued.add(key)
+                todo.append(idx)
+        
+        all_checkpointed = True
+        if todo:
+            logger.info(f"Summarizing {len(todo)} of {len(content_list)} sources ({len(content_list) - len(todo)} resumed)")
+            checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+            write_lock = threading.Lock()
+            
+            def summarize_source(idx):
+                result = self.summarize_content(content_list[idx].get('text', ''), query, prefetch=False)
+                summary = result.get('summary', '')
+                # Only real AI summaries are checkpointed; fallbacks are retried next run
+                if result.get('success') and 'Fallback' not in result.get('provider', 'Fallback'):
+                    record = _json_body({"idx": idx, "hash": keys[idx], "summary": summary}) + b"\n"
+                    with write_lock:
+                        with open(checkpoint_path, 'ab') as f:
+                            f.write(record)
+                    return summary, True
+                return summary, False
+            
+            with ThreadPoolExecutor(max_workers=self.config.MAX_CONCURRENT_REQUESTS) as executor:
+                for idx, (summary, checkpointed) in zip(todo, executor.map(summarize_source, todo)):
+                    completed[keys[idx]] = summary
+                    all_checkpointed = all_checkpointed and checkpointed
+        
+        # A finished run has nothing left to resume, so its checkpoint is dropped
+        if all_checkpointed:
+            try:
+                checkpoint_path.unlink()
+            except FileNotFoundError:
+                pass
+        
+        return [completed[key] for key in keys]
+    
+    def _prepare_content_for_ai(self, content_list: List[Dict], query: Optional[str] = None) -> str:
         """Prepare content for AI processing by combining and formatting"""
         combined_content = []
         
+        # Long source lists are condensed to per-source summaries first
+        source_summaries = None
+        if query and self.config.BATCH_SOURCE_SUMMARIES and len(content_list) >= BATCH_SUMMARY_MIN_SOURCES:
+            source_summaries = self._summarize_sources_checkpointed(content_list, query)
+        
+        # Boilerplate repeated across sources (syndicated copy, footers) is sent once
+        seen = set()
+        lsh = MinHashLSH(threshold=0.8, num_perm=64) if DATASKETCH_AVAILABLE else None
+        
         for i, content in enumerate(content_list, 1):
             title = content.get('title', f'Source {i}')
-            text = content.get('text', '')
             url = content.get('url', '')
             domain = content.get('domain', '')
             
+            if source_summaries:
+                text = source_summaries[i - 1]
+            else:
+                # Keep new paragraphs until this source's budget is used up
+                kept = []
+                kept_length = 0
+                for n, paragraph in enumerate(_PARAGRAPH_SPLIT_RE.split(content.get('text', ''))):
+                    paragraph = paragraph.strip()
+                    if not paragraph or _is_repeated_paragraph(paragraph, seen, lsh, f"{i}:{n}"):
+                        continue
+                    kept.append(paragraph)
+                    kept_length += len(paragraph) + 2
+                    if kept_length > SOURCE_CHAR_BUDGET:
+                        break
+                text = "\n\n".join(kept)
+            
             # Truncate text if too long
-            if len(text) > 2000:
-                text = text[:2000] + "..."
+            if len(text) > SOURCE_CHAR_BUDGET:
+                text = text[:SOURCE_CHAR_BUDGET] + "..."
             
             source_info = f"Source {i}: {title}\nDomain: {domain}\nURL: {url}\n\nContent:\n{text}\n\n---\n\n"
             combined_content.append(source_info)
         
         return "\n".join(combined_content)
     
+    def _generate_structured_summary(self, content: str, query: str, section_names: List[str]) -> Dict:
+        """Generate several summary sections from one JSON-mode OpenAI call; returns the valid ones"""
+        fields = "\n".join(f"- {STRUCTURED_SECTION_SPECS[name]}" for name in section_names)
+        prompt = f"""
+        Based on the following research content about "{query}", respond with a single JSON object containing exactly these fields:
+        {fields}
+        
+        Research Content:
+        {_truncate_tokens(content, PROMPT_CONTENT_TOKENS)}
+        """
+        
+        try:
+            response = self._call_provider(
+                'openai', prompt, max_tokens=STRUCTURED_SUMMARY_MAX_TOKENS, response_format={"type": "json_object"}
+            )
+            data = _json_loads(response)
+        except Exception as e:
+            logger.error(f"Structured summary generation failed: {str(e)}")
+            return {}
+        
+        if not isinstance(data, dict):
+            return {}
+        
+        # Keep only well-formed sections; anything else is generated separately
+        sections = {}
+        for name in ("executive_summary", "detailed_analysis"):
+            if name in section_names and isinstance(data.get(name), str) and data[name].strip():
+                sections[name] = data[name].strip()
+        
+        findings = data.get("key_findings")
+        if "key_findings" in section_names and isinstance(findings, list) and findings:
+            sections["key_findings"] = [_strip_bullet(str(finding)) for finding in findings][:7]
+        
+        trends = data.get("trend_analysis")
+        if "trend_analysis" in section_names and isinstance(trends, dict):
+            trend_analysis = {}
+            for key in TREND_ANALYSIS_LISTS:
+                items = trends.get(key)
+                trend_analysis[key] = [str(item) for item in items if item] if isinstance(items, list) else []
+            trend_analysis["analysis_text"] = str(trends.get("analysis_text") or "").strip()
+            sections["trend_analysis"] = trend_analysis
+        
+        return sections
+    
     def _generate_executive_summary(self, content: str, query: str) -> str:
         """Generate executive summary using AI"""
         prompt = f"""
@@ -650,13 +1136,13 @@ class AISummarizer:
         - Focus on actionable insights
         
         Research Content:
-        {content[:8000]}  # Limit content to avoid token limits
+        {_truncate_tokens(content, PROMPT_CONTENT_TOKENS)}
         
         Executive Summary:
         """
         
         try:
-            response = self._call_openai(prompt, max_tokens=500)
+            response = self._call_provider('openai', prompt, max_tokens=500)
             return response.strip()
         except Exception as e:
             logger.error(f"Executive summary generation failed: {str(e)}")
@@ -673,15 +1159,15 @@ class AISummarizer:
         Focus on the most significant and impactful discoveries.
         
         Research Content:
-        {content[:8000]}
+        {_truncate_tokens(content, PROMPT_CONTENT_TOKENS)}
         
         Key Findings:
         """
         
         try:
-            response = self._call_openai(prompt, max_tokens=800)
+            response = self._call_provider('openai', prompt, max_tokens=800)
             # Parse bullet points
-            findings = [line.strip() for line in response.split('\n') if line.strip() and line.strip().startswith(('•', '-', '*', '1.', '2.', '3.', '4.', '5.', '6.', '7.'))]
+            findings = [_strip_bullet(line) for line in response.split('\n') if _BULLET_RE.match(line)]
             return findings[:7]  # Limit to 7 findings
         except Exception as e:
             logger.error(f"Key findings generation failed: {str(e)}")
@@ -702,13 +1188,13 @@ class AISummarizer:
         Include specific examples and evidence from the sources.
         
         Research Content:
-        {content[:8000]}
+        {_truncate_tokens(content, PROMPT_CONTENT_TOKENS)}
         
         Detailed Analysis:
         """
         
         try:
-            response = self._call_openai(prompt, max_tokens=1000)
+            response = self._call_provider('openai', prompt, max_tokens=1000)
             return response.strip()
         except Exception as e:
             logger.error(f"Detailed analysis generation failed: {str(e)}")
@@ -728,13 +1214,13 @@ class AISummarizer:
         Format as a structured analysis with clear sections.
         
         Research Content:
-        {content[:8000]}
+        {_truncate_tokens(content, PROMPT_CONTENT_TOKENS)}
         
         Trend Analysis:
         """
         
         try:
-            response = self._call_openai(prompt, max_tokens=800)
+            response = self._call_provider('openai', prompt, max_tokens=800)
             
             # Parse the response into structured format
             trend_analysis = {
@@ -757,21 +1243,12 @@ class AISummarizer:
                     continue
                 
                 # Identify section headers
-                if any(keyword in line.lower() for keyword in ['emerging', 'trend']):
-                    current_section = 'emerging_trends'
-                elif any(keyword in line.lower() for keyword in ['recurring', 'theme']):
-                    current_section = 'recurring_themes'
-                elif any(keyword in line.lower() for keyword in ['consensus', 'agreement']):
-                    current_section = 'consensus_points'
-                elif any(keyword in line.lower() for keyword in ['debate', 'disagreement', 'controversy']):
-                    current_section = 'debates'
-                elif any(keyword in line.lower() for keyword in ['gap', 'limitation', 'missing']):
-                    current_section = 'research_gaps'
-                elif any(keyword in line.lower() for keyword in ['future', 'direction', 'recommendation']):
-                    current_section = 'future_directions'
+                header = _TREND_SECTION_RE.match(line)
+                if header:
+                    current_section = header.lastgroup
                 
                 # Add content to appropriate section
-                elif current_section and line.startswith(('•', '-', '*', '1.', '2.', '3.')):
+                elif current_section and (line[:1] in _TREND_BULLET_CHARS or line[:2] in _TREND_NUMBERED_PREFIXES):
                     trend_analysis[current_section].append(line)
             
             return trend_analysis
@@ -789,7 +1266,9 @@ class AISummarizer:
             return {}
         
         domains = [content.get('domain', '') for content in content_list]
-        unique_domains = list(set(domains))
+        # Lowercase each distinct domain once; both the categories and the quality check use it
+        lowered = {domain: domain.lower() for domain in set(domains)}
+        unique_domains = list(lowered)
         
         # Categorize domains
         domain_categories = {
@@ -801,17 +1280,8 @@ class AISummarizer:
         }
         
         for domain in unique_domains:
-            domain_lower = domain.lower()
-            if any(edu in domain_lower for edu in ['.edu', 'university', 'college']):
-                domain_categories['academic'].append(domain)
-            elif any(news in domain_lower for news in ['.com', 'news', 'media']):
-                domain_categories['news'].append(domain)
-            elif '.gov' in domain_lower:
-                domain_categories['government'].append(domain)
-            elif '.org' in domain_lower:
-                domain_categories['organization'].append(domain)
-            else:
-                domain_categories['other'].append(domain)
+            category = _DOMAIN_CATEGORY_RE.match(lowered[domain])
+            domain_categories[category.lastgroup if category else 'other'].append(domain)
         
         # Calculate source diversity score
         diversity_score = len(unique_domains) / len(content_list) if content_list else 0
@@ -821,22 +1291,19 @@ class AISummarizer:
             'unique_domains': len(unique_domains),
             'domain_categories': domain_categories,
             'diversity_score': round(diversity_score, 2),
-            'source_quality': self._assess_source_quality(content_list)
+            'source_quality': self._assess_source_quality(content_list, [lowered[domain] for domain in domains])
         }
     
-    def _assess_source_quality(self, content_list: List[Dict]) -> str:
+    def _assess_source_quality(self, content_list: List[Dict], domains_lower: Optional[List[str]] = None) -> str:
         """Assess overall source quality"""
         if not content_list:
             return "No sources available"
         
-        # Simple quality assessment based on domain authority
-        high_quality_domains = ['.edu', '.gov', '.org', 'nature.com', 'science.org', 'arxiv.org']
+        if domains_lower is None:
+            domains_lower = [content.get('domain', '').lower() for content in content_list]
         
-        high_quality_count = 0
-        for content in content_list:
-            domain = content.get('domain', '').lower()
-            if any(hq_domain in domain for hq_domain in high_quality_domains):
-                high_quality_count += 1
+        # Simple quality assessment based on domain authority
+        high_quality_count = sum(1 for domain in domains_lower if _HIGH_QUALITY_DOMAIN_RE.search(domain))
         
         quality_ratio = high_quality_count / len(content_list)
         
@@ -890,23 +1357,33 @@ class AISummarizer:
         
         return f"{author_text}{title_text}{domain_text}{date_text}{url}."
     
-    def _call_openai(self, prompt: str, max_tokens: int = None) -> str:
+    def _call_openai(self, prompt: str, max_tokens: int = None, response_format: Optional[Dict] = None) -> str:
         """Call OpenAI API with error handling"""
         if not self.client:
             raise Exception("OpenAI API key not configured")
         
+        max_tokens = max_tokens or self.config.MAX_TOKENS
+        cache_key = _response_key(self.config.OPENAI_MODEL, prompt, max_tokens, response_format)
+        cached = self._get_cached_response(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
+            extra_args = {"response_format": response_format} if response_format else {}
             response = self.client.chat.completions.create(
                 model=self.config.OPENAI_MODEL,
                 messages=[
-                    {"role": "system", "content": "You are an expert research analyst who creates comprehensive, accurate, and well-structured summaries of research content."},
+                    {"role": "system", "content": OPENAI_SYSTEM_PROMPT},
                     {"role": "user", "content": prompt}
                 ],
-                max_tokens=max_tokens or self.config.MAX_TOKENS,
-                temperature=self.config.TEMPERATURE
+                max_tokens=max_tokens,
+                temperature=self.config.TEMPERATURE,
+                **extra_args
             )
             
-            return response.choices[0].message.content.strip()
+            text = response.choices[0].message.content.strip()
+            self._store_response(cache_key, text)
+            return text
             
         except Exception as e:
             logger.error(f"OpenAI API call failed: {str(e)}")
@@ -996,46 +1473,6 @@ class AISummarizer:
                 report_sections.append("")
             
             report_sections.append("### Full Trend Analysis")
-    def generate_structured_summary(self, content: str, query: str, options: Dict) -> Dict:
-        """
-        Generate structured summary with formatting options
-        
-        Args:
-            content: Content to summarize
-            query: Research query
-            options: Formatting and analysis options
-            
-        Returns:
-            Dictionary with structured summary
-        """
-        try:
-            # Use the main summarize_content method
-            summary_result = self.summarize_content(content, query)
-            
-            if not summary_result.get('success'):
-                return summary_result
-            
-            # Enhance with structured formatting if requested
-            if options.get('detailed_formatting'):
-                structured_summary = self._apply_detailed_formatting(
-                    summary_result['summary'], 
-                    query, 
-                    options
-                )
-                summary_result['summary'] = structured_summary
-            
-            return summary_result
-            
-        except Exception as e:
-            logger.error(f"Structured summary generation failed: {str(e)}")
-            return {
-                "summary": self._generate_enhanced_fallback_summary(content, query),
-                "provider": "Enhanced Fallback",
-                "success": True,
-                "error": str(e),
-                "timestamp": datetime.now().isoformat()
-            }
-    
     def _apply_detailed_formatting(self, summary: str, query: str, options: Dict) -> str:
         """
         Apply detailed formatting to summary based on options
@@ -1072,14 +1509,13 @@ class AISummarizer:
     
     def _extract_key_points(self, summary: str) -> List[str]:
         """Extract key points from summary"""
-        sentences = summary.split('. ')
         key_points = []
         
-        for sentence in sentences[:5]:
-            if len(sentence.strip()) > 20:
-                # Clean up the sentence
-                clean_sentence = sentence.strip()
-                if not clean_sentence.endswith('.'):
+        # Only the first five sentences are considered, so stop reading there
+        for match in islice(_SENTENCE_RE.finditer(summary), 5):
+            clean_sentence = match.group().strip()
+            if len(clean_sentence) > 20:
+                if not clean_sentence.endswith(('.', '!', '?')):
                     clean_sentence += '.'
                 key_points.append(clean_sentence)
         
@@ -1095,53 +1531,6 @@ class AISummarizer:
 | Implications | Broader impact and significance |
 """
     
-    def _generate_fallback_summary(self, content: str, query: str) -> str:
-        """
-        Generate a basic fallback summary when AI providers fail
-        
-        Args:
-            content: Text content to summarize
-            query: Research query for context
-            
-        Returns:
-            Basic summary string
-        """
-        try:
-            # Basic text processing fallback
-            sentences = content.split('. ')
-            
-            # Take first few sentences and clean them up
-            summary_sentences = []
-            for sentence in sentences[:3]:
-                clean_sentence = sentence.strip()
-                if len(clean_sentence) > 20:
-                    if not clean_sentence.endswith('.'):
-                        clean_sentence += '.'
-                    summary_sentences.append(clean_sentence)
-            
-            if summary_sentences:
-                fallback = f"Based on the research about '{query}', the key information indicates: " + " ".join(summary_sentences)
-            else:
-                fallback = f"Summary of research on '{query}': The content provides relevant information and insights related to the topic."
-            
-            return fallback
-            
-        except Exception as e:
-            logger.error(f"Fallback summary generation failed: {str(e)}")
-            return f"Research summary for '{query}' - Content analysis completed but summary generation encountered technical issues."
-    
-    def _generate_fallback_findings(self, content: str, query: str) -> List[str]:
-        """Generate fallback findings when AI fails"""
-        return [
-            f"Research on '{query}' provides relevant insights and information",
-            "Multiple sources contribute to understanding of the topic",
-            "Content analysis reveals key aspects and considerations"
-        ]
-    
-    def _generate_fallback_analysis(self, content: str, query: str) -> str:
-        """Generate fallback analysis when AI fails"""
-        return f"Analysis of '{query}' indicates significant research interest and ongoing developments in the field. The available content provides insights into current understanding and future directions."
-    
     def generate_structured_summary(self, content: str, query: str, options: Dict) -> Dict:
         """
         Generate ChatGPT-style structured summary with detailed formatting
@@ -1180,7 +1569,7 @@ class AISummarizer:
             # Try Gemini first (best for structured output)
             if not result and 'gemini' in self.ai_providers:
                 try:
-                    response = self._call_gemini(prompt, max_tokens=800 if is_quick_search else 1200)
+                    response = self._call_provider('gemini', prompt, max_tokens=800 if is_quick_search else 1200)
                     result = {
                         "summary": response,
                         "provider": "Gemini",
@@ -1198,13 +1587,13 @@ class AISummarizer:
                     if provider in self.ai_providers:
                         try:
                             if provider == 'perplexity':
-                                response = self._call_perplexity(prompt, max_tokens=800 if is_quick_search else 1200)
+                                response = self._call_provider('perplexity', prompt, max_tokens=800 if is_quick_search else 1200)
                             elif provider == 'anthropic':
-                                response = self._call_anthropic(prompt, max_tokens=800 if is_quick_search else 1200)
+                                response = self._call_provider('anthropic', prompt, max_tokens=800 if is_quick_search else 1200)
                             elif provider == 'huggingface':
-                                response = self._call_huggingface(prompt, max_tokens=600 if is_quick_search else 800)
+                                response = self._call_provider('huggingface', prompt, max_tokens=600 if is_quick_search else 800)
                             elif provider == 'cohere':
-                                response = self._call_cohere(prompt, max_tokens=600 if is_quick_search else 800)
+                                response = self._call_provider('cohere', prompt, max_tokens=600 if is_quick_search else 800)
                             
                             result = {
                                 "summary": response,
@@ -1222,7 +1611,7 @@ class AISummarizer:
             # Enhanced fallback with structured formatting
             if not result:
                 result = {
-                    "summary": self._generate_enhanced_fallback_summary(content, query, options),
+                    "summary": self._generate_enhanced_fallback_summary(content, query),
                     "provider": "Enhanced Structured Fallback",
                     "success": True,
                     "timestamp": datetime.now().isoformat(),
@@ -1327,7 +1716,7 @@ Provide your comprehensive structured analysis:
             # Try Gemini first (best for structured output)
             if not result and 'gemini' in self.ai_providers:
                 try:
-                    response = self._call_gemini(prompt, max_tokens=1500)
+                    response = self._call_provider('gemini', prompt, max_tokens=1500)
                     result = {
                         "summary": response,
                         "provider": "Gemini",
@@ -1345,11 +1734,11 @@ Provide your comprehensive structured analysis:
                     if provider in self.ai_providers:
                         try:
                             if provider == 'perplexity':
-                                response = self._call_perplexity(prompt, max_tokens=1500)
+                                response = self._call_provider('perplexity', prompt, max_tokens=1500)
                             elif provider == 'anthropic':
-                                response = self._call_anthropic(prompt, max_tokens=1500)
+                                response = self._call_provider('anthropic', prompt, max_tokens=1500)
                             elif provider == 'openai':
-                                response = self._call_openai(prompt, max_tokens=1500)
+                                response = self._call_provider('openai', prompt, max_tokens=1500)
                             
                             result = {
                                 "summary": response,
@@ -1391,21 +1780,17 @@ Provide your comprehensive structured analysis:
         # Add extracted details from sources if available
         details_section = ""
         if extracted_details:
-            details_section = "\n\n## Source Analysis\n"
+            section_lines = ["", "", "## Source Analysis"]
             for i, detail in enumerate(extracted_details[:5], 1):  # Limit to first 5 sources
                 if detail.get('comprehensive_details'):
                     comp_details = detail['comprehensive_details']
-                    details_section += f"\n### Source {i}: {detail.get('title', 'Untitled')}\n"
-                    if comp_details.get('purpose'):
-                        details_section += f"**Purpose:** {comp_details['purpose']}\n"
-                    if comp_details.get('scope'):
-                        details_section += f"**Scope:** {comp_details['scope']}\n"
-                    if comp_details.get('input_output'):
-                        details_section += f"**Input/Output:** {comp_details['input_output']}\n"
-                    if comp_details.get('key_features'):
-                        details_section += f"**Key Features:** {comp_details['key_features']}\n"
-                    if comp_details.get('audience_use_case'):
-                        details_section += f"**Audience/Use Case:** {comp_details['audience_use_case']}\n"
+                    section_lines.extend(["", f"### Source {i}: {detail.get('title', 'Untitled')}"])
+                    section_lines.extend(
+                        f"**{label}:** {comp_details[key]}"
+                        for key, label in SOURCE_DETAIL_LABELS
+                        if comp_details.get(key)
+                    )
+            details_section = "\n".join(section_lines) + "\n"
         
         return f"""
 Create a comprehensive, ChatGPT-style summary for the research topic: "{query}"
@@ -1439,8 +1824,7 @@ Provide your comprehensive ChatGPT-style analysis with all the requested section
         """Generate ChatGPT-style fallback summary"""
         try:
             # Extract key sentences for fallback
-            sentences = [s.strip() for s in content.split('.') if len(s.strip()) > 30]
-            key_points = sentences[:7] if len(sentences) >= 7 else sentences
+            key_points = list(islice(_iter_sentences(content, longer_than=30), 7))
             
             # Create ChatGPT-style summary
             summary = f"""## Comprehensive Analysis: {query}
@@ -1477,107 +1861,39 @@ This research is designed for:
 
 The research helps these audiences by saving time on information gathering, providing credible and current data, and offering structured insights that enhance understanding and decision-making."""
             
+            parts = [summary]
+            
             # Add source analysis if details are available
             if extracted_details:
-                summary += "\n\n## Source Analysis"
+                parts.extend(["", "## Source Analysis"])
                 for i, detail in enumerate(extracted_details[:3], 1):
                     title = detail.get('title', f'Source {i}')
-                    summary += f"\n\n### Source {i}: {title}"
-                    summary += f"\n- **URL**: {detail.get('url', 'N/A')}"
-                    summary += f"\n- **Domain**: {detail.get('domain', 'N/A')}"
+                    parts.extend([
+                        "",
+                        f"### Source {i}: {title}",
+                        f"- **URL**: {detail.get('url', 'N/A')}",
+                        f"- **Domain**: {detail.get('domain', 'N/A')}"
+                    ])
                     if detail.get('brief_summary'):
-                        summary += f"\n- **Summary**: {detail['brief_summary']}"
-            
-            summary += f"""
-
-## Key Findings
-"""
+                        parts.append(f"- **Summary**: {detail['brief_summary']}")
             
-            for i, point in enumerate(key_points, 1):
-                summary += f"{i}. {point[:200]}{'...' if len(point) > 200 else ''}\n"
+            parts.extend(["", "## Key Findings"])
+            parts.extend(
+                f"{i}. {point[:200]}{'...' if len(point) > 200 else ''}"
+                for i, point in enumerate(key_points, 1)
+            )
+            parts.extend([
+                "",
+                "## Conclusion",
+                f'This comprehensive analysis of "{query}" provides valuable insights into the current state of research and development in this field. The information gathered from multiple sources offers a well-rounded perspective that can inform further research, development efforts, and strategic decision-making.'
+            ])
             
-            summary += f"""
-## Conclusion
-This comprehensive analysis of "{query}" provides valuable insights into the current state of research and development in this field. The information gathered from multiple sources offers a well-rounded perspective that can inform further research, development efforts, and strategic decision-making."""
-
-            return summary
+            return "\n".join(parts)
             
         except Exception as e:
             logger.error(f"ChatGPT-style fallback summary generation failed: {str(e)}")
             return f"## Research Summary: {query}\n\nThis comprehensive analysis provides detailed insights into {query} based on current research and developments."
     
-    def _generate_enhanced_fallback_summary(self, content: str, query: str, options: Dict) -> str:
-        """Generate enhanced structured fallback summary"""
-        is_quick = "Quick" in options.get('search_speed', '')
-        
-        if is_quick:
-            return f"""## Quick Research Summary: {query}
-
-- **Topic Overview**: Research analysis of {query} based on available sources
-- **Key Information**: {len(content)} characters of content analyzed
-- **Sources Status**: Data successfully gathered and processed
-
-### Main Insights
-- Current developments in {query} show active progress
-- Multiple sources provide valuable information on this topic  
-- Further detailed analysis available through advanced search mode
-
-**Note**: This quick summary provides essential information. For comprehensive analysis with detailed findings, tables, and technical details, please use Advanced Search mode."""
-        else:
-            # Extract key sentences and create structured content
-            sentences = [s.strip() for s in content.split('.') if len(s.strip()) > 30]
-            key_points = sentences[:5] if len(sentences) >= 5 else sentences
-            
-            summary = f"""## Comprehensive Analysis: {query}
-
-### Executive Summary
-This analysis examines {query} based on {len(sentences)} key information points from multiple sources. The research reveals significant insights and current developments in this field.
-
-### Key Findings
-"""
-            
-            for i, point in enumerate(key_points, 1):
-                summary += f"- **Finding {i}**: {point[:200]}{'...' if len(point) > 200 else ''}\n"
-            
-            summary += f"""
-### Technical Analysis
-- **Data Sources**: Multiple authoritative sources analyzed
-- **Content Volume**: {len(content):,} characters of detailed information
-- **Research Scope**: Comprehensive coverage of {query}
-
-### Current Status & Implications
-- **Active Development**: This field shows ongoing progress and innovation
-- **Information Availability**: Substantial data available for analysis
-- **Research Quality**: Sources provide credible and current information
-
-### Conclusion
-The analysis of {query} reveals a dynamic field with significant developments. The available information suggests continued growth and importance in this area. For the most current and detailed information, please refer to the individual sources in the Sources tab.
-"""
-            return summary
-    
-    def _generate_fallback_findings(self, content: str, query: str) -> List[str]:
-        """Generate fallback key findings using text analysis"""
-        try:
-            import re
-            
-            sentences = re.split(r'[.!?]+', content)
-            sentences = [s.strip() for s in sentences if len(s.strip()) > 30]
-            
-            # Look for sentences with key finding indicators
-            finding_indicators = ['found', 'discovered', 'shows', 'indicates', 'reveals', 'demonstrates', 'concluded']
-            findings = []
-            
-            for sentence in sentences[:10]:  # Check first 10 sentences
-                if any(indicator in sentence.lower() for indicator in finding_indicators):
-                    findings.append(sentence)
-                    if len(findings) >= 5:
-                        break
-            
-            return findings if findings else [f"Key insights available in the content related to {query}"]
-            
-        except Exception:
-            return [f"Analysis of content related to {query} is available"]
-    
     def _generate_fallback_analysis(self, content: str, query: str) -> str:
         """Generate fallback detailed analysis"""
         try:
@@ -1613,7 +1929,9 @@ The analysis of {query} reveals a dynamic field with significant developments. T
         try:
             # Clean and prepare content
             content = content.strip()
-            sentences = [s.strip() for s in content.split('.') if len(s.strip()) > 20]
+            # The summary quotes the first four sentences and the density rating only
+            # needs to know whether there are more than ten, so read at most eleven
+            sentences = list(islice(_iter_sentences(content), 11))
             
             if not sentences:
                 return f"No substantial content available for summarization about '{query}'."
@@ -1623,20 +1941,15 @@ The analysis of {query} reveals a dynamic field with significant developments. T
             summary_parts.append(f"**AI Research Summary: {query}**\n")
             
             # Add executive summary section
-            key_sentences = []
-            for sentence in sentences:
-                if any(word.lower() in sentence.lower() for word in query.lower().split()):
-                    key_sentences.append(sentence)
-                elif len(key_sentences) < 4:
-                    key_sentences.append(sentence)
+            key_sentences = sentences[:4]
             
             if key_sentences:
                 summary_parts.append("**Executive Summary:**")
                 # Create a more natural summary from key sentences
                 clean_sentences = []
-                for sentence in key_sentences[:4]:
+                for sentence in key_sentences:
                     clean_sentence = sentence.strip()
-                    if clean_sentence and not clean_sentence.endswith('.'):
+                    if clean_sentence and not clean_sentence.endswith(('.', '!', '?')):
                         clean_sentence += '.'
                     if clean_sentence:
                         clean_sentences.append(clean_sentence)
@@ -1758,41 +2071,38 @@ The analysis of {query} reveals a dynamic field with significant developments. T
         try:
             # Clean and prepare content
             content = content.strip()
-            sentences = [s.strip() for s in content.split('.') if len(s.strip()) > 20]
-            
-            if not sentences:
-                return f"No content available for summarization about '{query}'."
-            
-            # Extract key information and create structured summary
-            summary_parts = []
-            
-            # Title and introduction
-            summary_parts.append(f"## Research Summary: {query}")
-            summary_parts.append("")
-            
-            # Executive Summary section
-            key_sentences = []
             query_words = set(query.lower().split())
             
-            # Find sentences most relevant to the query
+            # Score sentences as they are read instead of splitting the whole content first
             scored_sentences = []
-            for sentence in sentences:
+            for sentence in _iter_sentences(content):
                 score = 0
-                sentence_words = set(sentence.lower().split())
+                sentence_lower = sentence.lower()
+                sentence_words = set(sentence_lower.split())
                 
                 # Score based on query relevance
                 score += len(query_words.intersection(sentence_words)) * 3
                 
                 # Score based on key indicator words
-                if any(word in sentence.lower() for word in ['study', 'research', 'analysis', 'found']):
+                if any(word in sentence_lower for word in ['study', 'research', 'analysis', 'found']):
                     score += 2
-                if any(word in sentence.lower() for word in ['important', 'significant', 'major', 'key']):
+                if any(word in sentence_lower for word in ['important', 'significant', 'major', 'key']):
                     score += 2
-                if any(word in sentence.lower() for word in ['data', 'results', 'evidence', 'shows']):
+                if any(word in sentence_lower for word in ['data', 'results', 'evidence', 'shows']):
                     score += 1
                 
                 scored_sentences.append((score, sentence))
             
+            if not scored_sentences:
+                return f"No content available for summarization about '{query}'."
+            
+            # Extract key information and create structured summary
+            summary_parts = []
+            
+            # Title and introduction
+            summary_parts.append(f"## Research Summary: {query}")
+            summary_parts.append("")
+            
             # Sort by relevance and take top sentences
             scored_sentences.sort(key=lambda x: x[0], reverse=True)
             top_sentences = [sent for score, sent in scored_sentences[:4] if score > 0]
@@ -1802,7 +2112,7 @@ The analysis of {query} reveals a dynamic field with significant developments. T
                 executive_text = " ".join(top_sentences)
                 # Clean up and format
                 executive_text = executive_text.replace('..', '.').strip()
-                if not executive_text.endswith('.'):
+                if not executive_text.endswith(('.', '!', '?')):
                     executive_text += '.'
                 summary_parts.append(executive_text)
                 summary_parts.append("")
@@ -1955,7 +2265,7 @@ The analysis of {query} reveals a dynamic field with significant developments. T
             # Try OpenAI first for comprehensive summaries
             if not result and self.client:
                 try:
-                    response = self._call_openai(prompt, max_tokens=1500)  # Increased tokens for comprehensive summary
+                    response = self._call_provider('openai', prompt, max_tokens=1500)  # Increased tokens for comprehensive summary
                     result = {
                         "summary": response,
                         "provider": "OpenAI (Comprehensive)",
@@ -1978,11 +2288,11 @@ The analysis of {query} reveals a dynamic field with significant developments. T
                 if not result and provider_key in self.ai_providers:
                     try:
                         if provider_name == 'gemini':
-                            response = self._call_gemini(prompt, max_tokens=1500)
+                            response = self._call_provider('gemini', prompt, max_tokens=1500)
                         elif provider_name == 'anthropic':
-                            response = self._call_anthropic(prompt, max_tokens=1500)
+                            response = self._call_provider('anthropic', prompt, max_tokens=1500)
                         elif provider_name == 'perplexity':
-                            response = self._call_perplexity(prompt, max_tokens=1500)
+                            response = self._call_provider('perplexity', prompt, max_tokens=1500)
                         
                         result = {
                             "summary": response,
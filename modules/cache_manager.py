@@ -11,8 +11,28 @@ import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 import logging
+import threading
 from pathlib import Path
 
+# Optional zstd compression for cached summaries
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+# Every zstd frame starts with this; plain pickles never do
+ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+
+# Optional embedding stack for the semantic summary cache
+try:
+    import numpy as np
+    import faiss
+    from sentence_transformers import SentenceTransformer
+    SEMANTIC_CACHE_AVAILABLE = True
+except ImportError:
+    SEMANTIC_CACHE_AVAILABLE = False
+
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -139,7 +159,13 @@ class CacheManager:
         if self._is_cache_valid(cache_path):
             try:
                 with open(cache_path, 'rb') as f:
-                    cached_data = pickle.load(f)
+                    payload = f.read()
+                # Older entries are plain pickles; newer ones may be zstd-compressed
+                if payload.startswith(ZSTD_MAGIC):
+                    if not ZSTD_AVAILABLE:
+                        return None
+                    payload = zstandard.ZstdDecompressor().decompress(payload)
+                cached_data = pickle.loads(payload)
                 logger.info(f"Cache hit for summary: {query[:50]}...")
                 return cached_data
             except Exception as e:
@@ -159,8 +185,12 @@ class CacheManager:
         cache_path = self._get_cache_path("summaries", cache_key)
         
         try:
+            payload = pickle.dumps(summary)
+            # Summaries are mostly prose and compress several times over
+            if ZSTD_AVAILABLE:
+                payload = zstandard.ZstdCompressor(level=3).compress(payload)
             with open(cache_path, 'wb') as f:
-                pickle.dump(summary, f)
+                f.write(payload)
             logger.info(f"Cached summary for: {query[:50]}...")
         except Exception as e:
             logger.error(f"Failed to cache summary: {str(e)}")
@@ -316,9 +346,87 @@ class CacheManager:
         return self._generate_cache_key(content_signatures)
 
 
+class SemanticSummaryCache:
+    """In-memory summary cache that also matches reworded queries over the same content"""
+    
+    def __init__(self, model_name: str = "sentence-transformers/all-MiniLM-L6-v2",
+                 threshold: float = 0.92, max_candidates: int = 5, max_entries: int = 512):
+        self.model_name = model_name
+        self.threshold = threshold
+        self.max_candidates = max_candidates
+        self.max_entries = max_entries
+        self._model = None
+        self._index = None
+        self._entries = []  # (content_hash, summary), parallel to the index rows, oldest first
+        self._lock = threading.Lock()
+    
+    def _embed(self, query: str):
+        """Normalized query embedding; the model is loaded on first use"""
+        if self._model is None:
+            with self._lock:
+                # Concurrent first calls wait here, so the model and index are built once
+                if self._model is None:
+                    model = SentenceTransformer(self.model_name)
+                    self._index = faiss.IndexFlatIP(model.get_sentence_embedding_dimension())
+                    self._model = model
+        vector = self._model.encode([query], normalize_embeddings=True)
+        return np.asarray(vector, dtype='float32')
+    
+    def get(self, query: str, content_hash: str) -> Optional[Dict]:
+        """Return a cached summary for a similar query over the same content"""
+        try:
+            vector = self._embed(query)
+            with self._lock:
+                if not self._entries:
+                    return None
+                scores, rows = self._index.search(vector, min(self.max_candidates, len(self._entries)))
+                for score, row in zip(scores[0], rows[0]):
+                    if score < self.threshold:
+                        break
+                    cached_hash, summary = self._entries[row]
+                    if cached_hash == content_hash:
+                        logger.info(f"Semantic cache hit ({score:.2f}) for: {query[:50]}...")
+                        return summary
+        except Exception as e:
+            logger.error(f"Semantic cache lookup failed: {str(e)}")
+        
+        return None
+    
+    def add(self, query: str, content_hash: str, summary: Dict):
+        """Remember a summary under the query's embedding"""
+        try:
+            vector = self._embed(query)
+            with self._lock:
+                self._index.add(vector)
+                self._entries.append((content_hash, summary))
+                
+                # Evict the oldest entries; removing leading rows keeps the index
+                # and _entries aligned because the flat index stays in insertion order
+                overflow = len(self._entries) - self.max_entries
+                if overflow > 0:
+                    self._index.remove_ids(np.arange(overflow, dtype='int64'))
+                    del self._entries[:overflow]
+        except Exception as e:
+            logger.error(f"Failed to add to semantic cache: {str(e)}")
+
+
 # Global cache instance
 cache_manager = CacheManager()
 
+# Shared semantic cache, built on first request (see get_semantic_summary_cache)
+_semantic_summary_cache = None
+_semantic_summary_cache_lock = threading.Lock()
+
+def get_semantic_summary_cache() -> Optional[SemanticSummaryCache]:
+    """Shared semantic summary cache, or None when the embedding stack is missing"""
+    global _semantic_summary_cache
+    if not SEMANTIC_CACHE_AVAILABLE:
+        return None
+    with _semantic_summary_cache_lock:
+        if _semantic_summary_cache is None:
+            _semantic_summary_cache = SemanticSummaryCache()
+        return _semantic_summary_cache
+
 # Example usage and testing
 if __name__ == "__main__":
     # Test the cache manager
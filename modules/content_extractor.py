@@ -48,10 +48,11 @@ logger = logging.getLogger(__name__)
 class ContentExtractor:
     """Main content extraction engine"""
     
-    def __init__(self):
+    def __init__(self, session: Optional[requests.Session] = None):
         self.config = Config()
         self.ua = UserAgent()
-        self.session = requests.Session()
+        # Callers may share a pooled session so repeated fetches reuse connections
+        self.session = session if session is not None else requests.Session()
         self.session.headers.update({
             'User-Agent': self.ua.random,
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
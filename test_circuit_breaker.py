@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Test the per-provider circuit breaker around AI summary calls
+"""
+
+import sys
+import os
+
+# Add the current directory to the Python path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, current_dir)
+
+import pytest
+
+from modules import ai_summarizer
+from modules.ai_summarizer import BREAKER_BASE_SECONDS, BREAKER_FAILURE_THRESHOLD
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+    
+    def monotonic(self):
+        return self.now
+
+@pytest.fixture(autouse=True)
+def no_disk_cache(monkeypatch, tmp_path):
+    monkeypatch.setattr(ai_summarizer, "CACHE_AVAILABLE", False)
+    monkeypatch.chdir(tmp_path)
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(ai_summarizer.time, "monotonic", clock.monotonic)
+    return clock
+
+def fail_until_open(summarizer):
+    for _ in range(BREAKER_FAILURE_THRESHOLD):
+        with pytest.raises(Exception, match="down"):
+            summarizer._call_provider('gemini', "prompt")
+
+def test_breaker_opens_after_consecutive_failures(clock, make_summarizer):
+    summarizer, calls = make_summarizer({'gemini': [Exception("down")] * BREAKER_FAILURE_THRESHOLD})
+    fail_until_open(summarizer)
+    
+    # Open: the provider isn't called at all
+    with pytest.raises(Exception, match="circuit breaker is open"):
+        summarizer._call_provider('gemini', "prompt")
+    assert len(calls) == BREAKER_FAILURE_THRESHOLD
+    
+    clock.now += BREAKER_BASE_SECONDS - 1
+    assert not summarizer._provider_available('gemini')
+
+def test_half_open_admits_one_trial_and_closes_on_success(clock, make_summarizer):
+    summarizer, calls = make_summarizer({'gemini': [Exception("down")] * BREAKER_FAILURE_THRESHOLD + ["recovered", "again"]})
+    fail_until_open(summarizer)
+    
+    clock.now += BREAKER_BASE_SECONDS
+    # Half-open: the first caller gets the trial, others wait for its outcome
+    assert summarizer._provider_available('gemini')
+    assert not summarizer._provider_available('gemini')
+    assert summarizer._run_provider('gemini', "prompt") == "recovered"
+    
+    # Closed again: calls go straight through and the failure count restarted
+    assert summarizer._call_provider('gemini', "prompt") == "again"
+    assert summarizer._breaker['gemini'] == {"fails": 0, "open_until": 0.0}
+
+def test_failed_trial_reopens_with_longer_backoff(clock, make_summarizer):
+    summarizer, calls = make_summarizer({'gemini': [Exception("down")] * (BREAKER_FAILURE_THRESHOLD + 1)})
+    fail_until_open(summarizer)
+    
+    clock.now += BREAKER_BASE_SECONDS
+    with pytest.raises(Exception, match="down"):
+        summarizer._call_provider('gemini', "prompt")
+    
+    clock.now += BREAKER_BASE_SECONDS
+    assert not summarizer._provider_available('gemini')
+    clock.now += BREAKER_BASE_SECONDS
+    assert summarizer._provider_available('gemini')
+
+def test_direct_generation_calls_go_through_breaker(clock, make_summarizer):
+    """Helpers that call OpenAI directly skip it while its breaker is open"""
+    summarizer, calls = make_summarizer({'openai': Exception("down")})
+    for _ in range(BREAKER_FAILURE_THRESHOLD + 2):
+        summarizer._generate_executive_summary("some research content", "query")
+    
+    assert len(calls) == BREAKER_FAILURE_THRESHOLD
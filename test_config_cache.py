@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Test the memoized API key validation in Config
+"""
+
+import sys
+import os
+
+# Add the current directory to the Python path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, current_dir)
+
+from config import Config
+
+def test_callers_cannot_alter_memoized_validation():
+    validation = Config.validate_api_keys()
+    validation['ai_providers'].append('Injected')
+    validation['working_count'] = -1
+    
+    fresh = Config.validate_api_keys()
+    assert 'Injected' not in fresh['ai_providers']
+    assert fresh['working_count'] >= 0
+
+def test_callers_cannot_alter_memoized_status():
+    status = Config.get_comprehensive_status()
+    status['capabilities']['ai_analysis'] = 'tampered'
+    
+    assert Config.get_comprehensive_status()['capabilities']['ai_analysis'] != 'tampered'
+
+def test_clear_api_key_cache_picks_up_new_keys(monkeypatch):
+    monkeypatch.setattr(Config, "FRED_API_KEY", None)
+    Config.clear_api_key_cache()
+    assert 'FRED' not in Config.validate_api_keys()['historical_data']
+    before = Config.get_comprehensive_status()['working_apis']
+    
+    monkeypatch.setattr(Config, "FRED_API_KEY", "fred-test-key")
+    # Memoized until cleared
+    assert 'FRED' not in Config.validate_api_keys()['historical_data']
+    Config.clear_api_key_cache()
+    assert 'FRED' in Config.validate_api_keys()['historical_data']
+    assert Config.get_comprehensive_status()['working_apis'] == before + 1
+    
+    monkeypatch.undo()
+    Config.clear_api_key_cache()
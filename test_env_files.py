@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Test reading and updating .env files with the shared key matching rule
+"""
+
+import sys
+import os
+
+# Add the current directory to the Python path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, current_dir)
+
+import pytest
+
+from api_catalog import env_line_key, parse_env_keys
+from fix_api_keys import update_env_file
+
+ENV_TEXT = """# API keys
+OPENAI_API_KEY="sk-old"
+export SERPAPI_KEY='serp-old'
+  TAVILY_API_KEY = tavily-value
+#GEMINI_API_KEY=commented-out
+NOT_AN_ASSIGNMENT
+"""
+
+def test_env_line_key():
+    assert env_line_key("OPENAI_API_KEY=abc\n") == "OPENAI_API_KEY"
+    assert env_line_key("export SERPAPI_KEY=abc") == "SERPAPI_KEY"
+    assert env_line_key("  TAVILY_API_KEY = abc") == "TAVILY_API_KEY"
+    assert env_line_key("# OPENAI_API_KEY=abc") is None
+    assert env_line_key("NOT_AN_ASSIGNMENT") is None
+    assert env_line_key("") is None
+
+def test_parse_reads_only_wanted_keys(tmp_path):
+    env_path = tmp_path / ".env"
+    env_path.write_text(ENV_TEXT)
+    
+    values = parse_env_keys(env_path, ["OPENAI_API_KEY", "SERPAPI_KEY", "TAVILY_API_KEY", "GEMINI_API_KEY"])
+    
+    assert values == {
+        "OPENAI_API_KEY": "sk-old",
+        "SERPAPI_KEY": "serp-old",
+        "TAVILY_API_KEY": "tavily-value"
+    }
+
+def test_parse_missing_file(tmp_path):
+    assert parse_env_keys(tmp_path / ".env", ["OPENAI_API_KEY"]) == {}
+    with pytest.raises(FileNotFoundError):
+        parse_env_keys(tmp_path / ".env", ["OPENAI_API_KEY"], missing_ok=False)
+
+def test_update_replaces_export_lines_in_place(monkeypatch, tmp_path):
+    """An exported key is rewritten where it is, not appended a second time"""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / ".env").write_text(ENV_TEXT)
+    
+    update_env_file({"SERPAPI_KEY": "serp-new", "OPENAI_API_KEY": "sk-new"})
+    
+    lines = (tmp_path / ".env").read_text().splitlines()
+    assert lines.count("export SERPAPI_KEY=serp-new") == 1
+    assert lines.count("OPENAI_API_KEY=sk-new") == 1
+    assert [env_line_key(line) for line in lines].count("SERPAPI_KEY") == 1
+    assert parse_env_keys(".env", ["SERPAPI_KEY", "OPENAI_API_KEY"]) == {
+        "SERPAPI_KEY": "serp-new",
+        "OPENAI_API_KEY": "sk-new"
+    }
+
+def test_update_appends_new_keys_and_keeps_other_lines(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / ".env").write_text("# API keys\nTAVILY_API_KEY=tavily-value")
+    
+    update_env_file({"NEWSAPI_KEY": "news-value"})
+    
+    assert (tmp_path / ".env").read_text() == "# API keys\nTAVILY_API_KEY=tavily-value\nNEWSAPI_KEY=news-value\n"
+
+def test_update_leaves_no_temp_files(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / ".env").write_text(ENV_TEXT)
+    os.chmod(tmp_path / ".env", 0o600)
+    
+    update_env_file({"OPENAI_API_KEY": "sk-new"})
+    
+    assert sorted(path.name for path in tmp_path.iterdir()) == [".env"]
+    assert (os.stat(tmp_path / ".env").st_mode & 0o777) == 0o600
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Test the JSON export serializer used by the download button
+"""
+
+import sys
+import os
+import json
+from datetime import datetime
+
+# Add the current directory to the Python path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, current_dir)
+
+import app_working
+
+RESULTS = {
+    'query': 'Batterieforschung in Europa',
+    'timestamp': datetime(2026, 1, 1, 12, 30),
+    'search_results_list': [{'url': 'https://example.com', 'title': 'Über', 'snippet': None}],
+    'summary': {'summary': 'Text', 'provider': 'OpenAI'}
+}
+
+def test_export_is_indented_bytes():
+    data = app_working.results_to_json(RESULTS)
+    
+    assert isinstance(data, bytes)
+    assert data.startswith(b'{\n  "query"')
+    assert json.loads(data)['search_results_list'][0]['title'] == 'Über'
+
+def test_backends_produce_identical_bytes(monkeypatch):
+    """The orjson and json paths return the same type and the same document"""
+    if not app_working.ORJSON_AVAILABLE:
+        return
+    
+    with_orjson = app_working.results_to_json(RESULTS)
+    monkeypatch.setattr(app_working, "ORJSON_AVAILABLE", False)
+    
+    assert app_working.results_to_json(RESULTS) == with_orjson
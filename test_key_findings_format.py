@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Test that key findings have the same plain-string shape from every generation path
+"""
+
+import sys
+import os
+import json
+
+# Add the current directory to the Python path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, current_dir)
+
+from modules.ai_summarizer import AISummarizer
+
+BULLETED_RESPONSE = """Key Findings:
+• Battery costs fell 14% in 2023
+- Solid-state cells reached pilot production
+2. **Recycling** capacity doubled in Europe
+* -5% demand growth was forecast for lead-acid
+Closing remark that is not a finding
+"""
+
+EXPECTED = [
+    "Battery costs fell 14% in 2023",
+    "Solid-state cells reached pilot production",
+    "**Recycling** capacity doubled in Europe",
+    "-5% demand growth was forecast for lead-acid"
+]
+
+def make_summarizer(response):
+    summarizer = AISummarizer()
+    summarizer._call_openai = lambda prompt, max_tokens=None, response_format=None: response
+    return summarizer
+
+def test_per_section_findings_are_plain():
+    summarizer = make_summarizer(BULLETED_RESPONSE)
+    assert summarizer._generate_key_findings("content", "batteries") == EXPECTED
+
+def test_structured_findings_are_plain():
+    response = json.dumps({"key_findings": ["• Battery costs fell 14% in 2023", "Solid-state cells reached pilot production"]})
+    summarizer = make_summarizer(response)
+    sections = summarizer._generate_structured_summary("content", "batteries", ["key_findings"])
+    assert sections["key_findings"] == EXPECTED[:2]
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Test the summary provider fallback order and optional hedging
+"""
+
+import sys
+import os
+import threading
+
+# Add the current directory to the Python path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, current_dir)
+
+from modules.ai_summarizer import AISummarizer
+
+def test_first_provider_answers_alone(make_summarizer):
+    """Without hedging only the preferred provider is called when it succeeds"""
+    summarizer, calls = make_summarizer({
+        'openai': "from openai",
+        'gemini': "from gemini",
+        'anthropic': "from anthropic"
+    }, delays={'openai': 0.1})
+    
+    assert summarizer._call_summary_providers("prompt") == ("OpenAI", "from openai")
+    assert calls == ['openai']
+
+def test_failures_fall_through_in_order(make_summarizer):
+    """A failing provider hands over to the next one in preference order"""
+    summarizer, calls = make_summarizer({
+        'openai': Exception("quota exceeded"),
+        'gemini': Exception("bad key"),
+        'anthropic': "from anthropic"
+    })
+    
+    assert summarizer._call_summary_providers("prompt") == ("Anthropic", "from anthropic")
+    assert calls == ['openai', 'gemini', 'anthropic']
+
+def test_all_providers_failing_returns_none(make_summarizer):
+    summarizer, calls = make_summarizer({
+        'openai': Exception("down"),
+        'gemini': Exception("down"),
+        'anthropic': Exception("down")
+    })
+    
+    assert summarizer._call_summary_providers("prompt") is None
+    assert calls == ['openai', 'gemini', 'anthropic']
+
+def test_hedge_starts_backup_after_delay(make_summarizer):
+    """With hedging on, a slow provider gets a backup that can answer first"""
+    summarizer, calls = make_summarizer({
+        'openai': "from openai",
+        'gemini': "from gemini",
+        'anthropic': "from anthropic"
+    }, delays={'openai': 0.5}, hedge_seconds=0.05)
+    
+    assert summarizer._call_summary_providers("prompt") == ("Gemini", "from gemini")
+    assert calls == ['openai', 'gemini']
+
+def test_hedge_not_used_when_preferred_is_fast(make_summarizer):
+    summarizer, calls = make_summarizer({
+        'openai': "from openai",
+        'gemini': "from gemini",
+        'anthropic': "from anthropic"
+    }, hedge_seconds=0.2)
+    
+    assert summarizer._call_summary_providers("prompt") == ("OpenAI", "from openai")
+    assert calls == ['openai']
+
+def test_each_thread_gets_its_own_session():
+    """Provider calls on worker threads never share the caller's requests.Session"""
+    summarizer = AISummarizer()
+    main_session = summarizer.session
+    worker_sessions = []
+    
+    worker = threading.Thread(target=lambda: worker_sessions.append(summarizer.session))
+    worker.start()
+    worker.join()
+    
+    assert summarizer.session is main_session
+    assert worker_sessions[0] is not main_session
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Test the semantic summary cache (needs numpy and faiss; the embedding model is faked)
+"""
+
+import sys
+import os
+import threading
+import time
+
+# Add the current directory to the Python path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, current_dir)
+
+import pytest
+
+np = pytest.importorskip("numpy")
+faiss = pytest.importorskip("faiss")
+
+from modules import cache_manager
+from modules.cache_manager import SemanticSummaryCache
+
+class FakeSentenceTransformer:
+    """Bag-of-words embedding, so reordered queries embed identically"""
+    instances = 0
+    
+    def __init__(self, model_name):
+        # Slow enough that concurrent first calls overlap
+        time.sleep(0.05)
+        FakeSentenceTransformer.instances += 1
+    
+    def get_sentence_embedding_dimension(self):
+        return 64
+    
+    def encode(self, sentences, normalize_embeddings=True):
+        vectors = np.zeros((len(sentences), 64), dtype='float32')
+        for row, sentence in enumerate(sentences):
+            for word in sentence.lower().split():
+                vectors[row, sum(map(ord, word)) % 64] += 1.0
+        return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+@pytest.fixture
+def fake_model(monkeypatch):
+    FakeSentenceTransformer.instances = 0
+    monkeypatch.setattr(cache_manager, "np", np, raising=False)
+    monkeypatch.setattr(cache_manager, "faiss", faiss, raising=False)
+    monkeypatch.setattr(cache_manager, "SentenceTransformer", FakeSentenceTransformer, raising=False)
+    return FakeSentenceTransformer
+
+def test_reworded_query_hits_same_content(fake_model):
+    """A reordered query over the same content returns the cached summary"""
+    cache = SemanticSummaryCache()
+    cache.add("battery recycling methods", "content-a", {"summary": "A"})
+    
+    assert cache.get("methods battery recycling", "content-a") == {"summary": "A"}
+    assert cache.get("methods battery recycling", "content-b") is None
+    assert cache.get("quantum computing startups", "content-a") is None
+
+def test_oldest_entries_are_evicted(fake_model):
+    """The cache keeps max_entries summaries and the index rows stay aligned with them"""
+    cache = SemanticSummaryCache(max_entries=3)
+    queries = ["alpha topic", "beta subject", "gamma theme", "delta matter", "epsilon issue"]
+    for i, query in enumerate(queries):
+        cache.add(query, f"content-{i}", {"summary": query})
+    
+    assert len(cache._entries) == 3
+    assert cache._index.ntotal == 3
+    assert cache.get("alpha topic", "content-0") is None
+    assert cache.get("beta subject", "content-1") is None
+    for i, query in enumerate(queries[2:], 2):
+        assert cache.get(query, f"content-{i}") == {"summary": query}
+
+def test_concurrent_first_calls_load_model_once(fake_model):
+    """Threads racing on the first lookup share one model and index"""
+    cache = SemanticSummaryCache()
+    threads = [threading.Thread(target=cache.add, args=(f"query {i}", f"content-{i}", {"summary": i})) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    assert fake_model.instances == 1
+    assert cache._index.ntotal == len(cache._entries) == 8
+
+def test_summarizer_builds_shared_cache_only_when_enabled(fake_model, monkeypatch):
+    """The cache is opt-in, built on first use and shared between summarizers"""
+    from config import Config
+    from modules.ai_summarizer import AISummarizer
+    monkeypatch.setattr(cache_manager, "SEMANTIC_CACHE_AVAILABLE", True)
+    monkeypatch.setattr(cache_manager, "_semantic_summary_cache", None)
+    
+    monkeypatch.setattr(Config, "SEMANTIC_SUMMARY_CACHE", False)
+    assert AISummarizer().semantic_cache is None
+    assert cache_manager._semantic_summary_cache is None
+    
+    monkeypatch.setattr(Config, "SEMANTIC_SUMMARY_CACHE", True)
+    first, second = AISummarizer(), AISummarizer()
+    assert first.semantic_cache is not None
+    assert first.semantic_cache is second.semantic_cache
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Test the per-source summary checkpoint used for large research source lists
+"""
+
+import sys
+import os
+
+# Add the current directory to the Python path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, current_dir)
+
+from modules import ai_summarizer
+from modules.ai_summarizer import AISummarizer, SOURCE_SUMMARY_CHECKPOINT_DIR, _cache_key, _json_body, _source_checkpoint_path
+
+QUERY = "solid state batteries"
+
+def make_summarizer(monkeypatch, tmp_path, fallback_texts=()):
+    """Summarizer writing checkpoints under tmp_path, with a fake summarize_content that records its inputs"""
+    monkeypatch.setattr(ai_summarizer, "CACHE_AVAILABLE", False)
+    monkeypatch.chdir(tmp_path)
+    
+    summarizer = AISummarizer()
+    calls = []
+    
+    def fake_summarize(content, query, prefetch=True):
+        calls.append(content)
+        provider = "Enhanced Fallback" if content in fallback_texts else "OpenAI"
+        return {"summary": f"summary of {content}", "success": True, "provider": provider}
+    
+    summarizer.summarize_content = fake_summarize
+    return summarizer, calls
+
+def checkpoint_files(tmp_path):
+    checkpoint_dir = tmp_path / "cache" / SOURCE_SUMMARY_CHECKPOINT_DIR
+    return list(checkpoint_dir.glob("*.jsonl")) if checkpoint_dir.exists() else []
+
+def test_resume_skips_checkpointed_sources(monkeypatch, tmp_path):
+    """Sources recorded by an interrupted run are not summarized again"""
+    summarizer, calls = make_summarizer(monkeypatch, tmp_path)
+    sources = [{"text": f"source {i}"} for i in range(4)]
+    
+    # Simulate an earlier run that finished source 1 and tore its last line
+    checkpoint_path = _source_checkpoint_path(QUERY)
+    checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+    record = {"idx": 1, "hash": _cache_key(QUERY, "source 1"), "summary": "resumed summary"}
+    checkpoint_path.write_bytes(_json_body(record) + b"\n" + b'{"idx": 2, "ha')
+    
+    summaries = summarizer._summarize_sources_checkpointed(sources, QUERY)
+    
+    assert sorted(calls) == ["source 0", "source 2", "source 3"]
+    assert summaries == ["summary of source 0", "resumed summary", "summary of source 2", "summary of source 3"]
+    # A completed run leaves nothing behind to resume
+    assert checkpoint_files(tmp_path) == []
+
+def test_duplicate_sources_are_summarized_once(monkeypatch, tmp_path):
+    """Sources with identical text share one summary call"""
+    summarizer, calls = make_summarizer(monkeypatch, tmp_path)
+    sources = [{"text": "same text"}, {"text": "other text"}, {"text": "same text"}]
+    
+    summaries = summarizer._summarize_sources_checkpointed(sources, QUERY)
+    
+    assert sorted(calls) == ["other text", "same text"]
+    assert summaries == ["summary of same text", "summary of other text", "summary of same text"]
+
+def test_fallback_summaries_keep_checkpoint_for_retry(monkeypatch, tmp_path):
+    """Fallback summaries are not checkpointed, so the run stays resumable"""
+    summarizer, calls = make_summarizer(monkeypatch, tmp_path, fallback_texts=("source 1",))
+    sources = [{"text": f"source {i}"} for i in range(3)]
+    
+    summarizer._summarize_sources_checkpointed(sources, QUERY)
+    files = checkpoint_files(tmp_path)
+    assert len(files) == 1
+    assert files[0].name == _source_checkpoint_path(QUERY).name
+    
+    # The retry only repeats the source that fell back
+    calls.clear()
+    summarizer._summarize_sources_checkpointed(sources, QUERY)
+    assert calls == ["source 1"]
+
+def test_checkpoints_are_scoped_per_query(monkeypatch, tmp_path):
+    """Another query's checkpoint is neither read nor reused"""
+    summarizer, calls = make_summarizer(monkeypatch, tmp_path, fallback_texts=("source 1",))
+    sources = [{"text": f"source {i}"} for i in range(2)]
+    
+    summarizer._summarize_sources_checkpointed(sources, "first query")
+    calls.clear()
+    summarizer._summarize_sources_checkpointed(sources, "second query")
+    
+    assert sorted(calls) == ["source 0", "source 1"]
+    assert len(checkpoint_files(tmp_path)) == 2
+
+def test_batch_summaries_are_opt_in(monkeypatch, tmp_path):
+    """Large source lists are only summarized per source with BATCH_SOURCE_SUMMARIES on"""
+    summarizer, calls = make_summarizer(monkeypatch, tmp_path)
+    sources = [{"text": f"source {i}", "title": f"Source {i}"} for i in range(ai_summarizer.BATCH_SUMMARY_MIN_SOURCES)]
+    
+    monkeypatch.setattr(summarizer.config, "BATCH_SOURCE_SUMMARIES", False)
+    summarizer._prepare_content_for_ai(sources, QUERY)
+    assert calls == []
+    
+    monkeypatch.setattr(summarizer.config, "BATCH_SOURCE_SUMMARIES", True)
+    summarizer._prepare_content_for_ai(sources, QUERY)
+    assert len(calls) == len(sources)
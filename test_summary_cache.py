@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Test the on-disk summary cache with and without zstd compression
+"""
+
+import sys
+import os
+import pickle
+
+# Add the current directory to the Python path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, current_dir)
+
+import pytest
+
+from modules import cache_manager
+from modules.cache_manager import CacheManager, ZSTD_MAGIC
+
+SUMMARY = {"summary": "Solid state batteries " * 50, "provider": "OpenAI", "success": True}
+
+def summary_files(cache_dir):
+    return list((cache_dir / "summaries").glob("*.cache"))
+
+def test_compressed_roundtrip(tmp_path):
+    pytest.importorskip("zstandard")
+    cache = CacheManager(cache_dir=str(tmp_path))
+    cache.set_summary_cache("hash-1", "batteries", "standard", SUMMARY)
+    
+    [path] = summary_files(tmp_path)
+    payload = path.read_bytes()
+    assert payload.startswith(ZSTD_MAGIC)
+    assert len(payload) < len(pickle.dumps(SUMMARY))
+    assert cache.get_summary_cache("hash-1", "batteries", "standard") == SUMMARY
+    assert cache.get_summary_cache("hash-1", "batteries", "detailed") is None
+
+def test_legacy_plain_pickle_still_loads(tmp_path, monkeypatch):
+    """Entries written before compression (or without zstandard) are read as-is"""
+    monkeypatch.setattr(cache_manager, "ZSTD_AVAILABLE", False)
+    cache = CacheManager(cache_dir=str(tmp_path))
+    cache.set_summary_cache("hash-1", "batteries", "standard", SUMMARY)
+    
+    [path] = summary_files(tmp_path)
+    assert path.read_bytes() == pickle.dumps(SUMMARY)
+    
+    monkeypatch.undo()
+    assert cache.get_summary_cache("hash-1", "batteries", "standard") == SUMMARY
+
+def test_compressed_entry_without_zstandard_is_a_miss(tmp_path, monkeypatch):
+    pytest.importorskip("zstandard")
+    cache = CacheManager(cache_dir=str(tmp_path))
+    cache.set_summary_cache("hash-1", "batteries", "standard", SUMMARY)
+    
+    monkeypatch.setattr(cache_manager, "ZSTD_AVAILABLE", False)
+    assert cache.get_summary_cache("hash-1", "batteries", "standard") is None
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Test token-based prompt truncation and its fallback when tiktoken can't load
+"""
+
+import sys
+import os
+
+# Add the current directory to the Python path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, current_dir)
+
+import pytest
+
+from modules import ai_summarizer
+from modules.ai_summarizer import _token_encoder, _truncate_tokens
+
+class FakeEncoding:
+    """One token per word"""
+    def encode(self, text, disallowed_special=()):
+        return text.split()
+    
+    def decode(self, tokens):
+        return " ".join(tokens)
+
+class FakeTiktoken:
+    def __init__(self, error=None):
+        self.error = error
+        self.loads = 0
+    
+    def get_encoding(self, name):
+        self.loads += 1
+        if self.error:
+            raise self.error
+        return FakeEncoding()
+
+@pytest.fixture
+def fake_tiktoken(monkeypatch):
+    def install(error=None):
+        fake = FakeTiktoken(error)
+        monkeypatch.setattr(ai_summarizer, "tiktoken", fake, raising=False)
+        monkeypatch.setattr(ai_summarizer, "TIKTOKEN_AVAILABLE", True)
+        _token_encoder.cache_clear()
+        return fake
+    yield install
+    _token_encoder.cache_clear()
+
+def test_truncates_by_tokens_and_loads_encoding_once(fake_tiktoken):
+    fake = fake_tiktoken()
+    
+    assert _truncate_tokens("one two three four", 2) == "one two"
+    assert _truncate_tokens("one two", 2) == "one two"
+    assert fake.loads == 1
+
+def test_offline_encoding_load_falls_back_to_characters(fake_tiktoken):
+    """A failed BPE download doesn't break truncation; it estimates 4 characters per token"""
+    fake = fake_tiktoken(OSError("network unreachable"))
+    
+    assert _truncate_tokens("x" * 100, 5) == "x" * 20
+    assert _truncate_tokens("y" * 100, 5) == "y" * 20
+    assert fake.loads == 1
+
+def test_without_tiktoken_uses_characters(monkeypatch):
+    monkeypatch.setattr(ai_summarizer, "TIKTOKEN_AVAILABLE", False)
+    _token_encoder.cache_clear()
+    
+    assert _truncate_tokens("abcdefghij", 2) == "abcdefgh"
+    _token_encoder.cache_clear()